@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Flight Energy Simulation - One-shot database schema setup
+Copyright (C) 2025 wolkstein
+
+Creates all tables once before the API workers start. Run the workers with
+SKIP_DB_INIT=1 so they do not repeat the schema check on every start.
+
+Usage:
+    python init_db.py
+"""
+
+from models.database import init_db
+
+if __name__ == "__main__":
+    init_db()
+    print("Database schema ready")
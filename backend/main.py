@@ -17,206 +17,323 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from starlette.datastructures import Headers
 import uvicorn
 from typing import List, Optional
+import asyncio
+import gzip
+import logging
+from contextlib import asynccontextmanager
 import os
+import orjson
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
-from models.database import engine, SessionLocal, Base
+from models.database import init_db, SimulationSession
 from models.vehicles import VehicleType, VehicleConfig
-from models.simulation import SimulationRequest, SimulationResult
-from models.waypoint import Waypoint, WaypointPlan
+from models.simulation import SimulationRequest, SimulationResult, SessionSummary
+from models.waypoint import Waypoint, WaypointPlan, ElevationProfileRequest
 from models.user import User
 from services.energy_calculator import EnergyCalculator
 from services.wind_service import WindService
 from services.session_service import SessionService
 from services.auth_service import get_current_active_user, get_db
-from routes import auth_routes, group_routes
+from services.group_service import can_access_loaded_session
+from routes import auth_routes, group_routes, wind_routes
 # REMOVED: elevation_routes (moved to simulation-specific settings)
 
 # Load environment variables
 load_dotenv()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+def check_unique_routes(app: FastAPI):
+    """Doppelt registrierte Endpunkte (gleicher Pfad + Methode) beim Start melden
+    
+    FastAPI bedient bei Duplikaten stillschweigend nur die zuerst registrierte Route.
+    """
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (route.path, method)
+            if key in seen:
+                raise RuntimeError(f"Route registered twice: {method} {route.path}")
+            seen.add(key)
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Prüfen, ob Accept-Encoding gzip mit q > 0 erlaubt (gzip;q=0 lehnt gzip ab)"""
+    explicit = None
+    wildcard = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding in ("gzip", "x-gzip"):
+            explicit = quality if explicit is None else max(explicit, quality)
+        elif coding == "*":
+            wildcard = quality
+    if explicit is not None:
+        return explicit > 0
+    return wildcard is not None and wildcard > 0
+
+class QValueGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware, die q-Werte beachtet - Starlette prüft nur, ob "gzip" im Header vorkommt"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not _accepts_gzip(Headers(scope=scope).get("Accept-Encoding", "")):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Gemeinsame Ressourcen beim Start anlegen und beim Beenden freigeben"""
+    check_unique_routes(app)
+    # Tabellen anlegen - entfällt, wenn das Schema einmalig über init_db.py angelegt wird
+    if os.getenv("SKIP_DB_INIT") != "1":
+        await asyncio.to_thread(init_db)
+    await wind_service.start()
+    yield
+    await wind_service.close()
 
 app = FastAPI(
     title="Flight Energy Simulation API",
     description="API für die Simulation des Energieverbrauchs von Flugzeugen",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Include routers
 app.include_router(auth_routes.router)
 app.include_router(group_routes.router)
+app.include_router(wind_routes.router)
 # REMOVED: app.include_router(elevation_routes.router) - moved to simulation-specific settings
 
-# CORS middleware
+# Große JSON-Antworten (Simulation, Sessions, Profile) komprimieren.
+# Vor CORS registrieren, damit CORS die äußerste Middleware bleibt.
+app.add_middleware(QValueGZipMiddleware, minimum_size=1024)
+
+# CORS middleware - feste Origin-Liste (kommagetrennt in FRONTEND_ORIGIN),
+# da Browser "*" zusammen mit Credentials ablehnen
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("FRONTEND_ORIGIN", "http://localhost:3000").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
-# Dependency für Datenbankverbindung
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Services
 energy_calculator = EnergyCalculator()
 wind_service = WindService()
 session_service = SessionService()
+app.state.wind_service = wind_service
 
 # Elevation Service (lazy import to avoid startup issues)
 def get_elevation_service():
     from services.elevation_service import elevation_service
     return elevation_service
 
+# Statische Antworten einmalig beim Import serialisieren
+_ROOT_JSON = orjson.dumps({"message": "Flight Energy Simulation API", "version": "1.0.0"})
+_HEALTH_JSON = orjson.dumps({"status": "ok", "elevation_service": "ready_for_implementation"})
+
 @app.get("/")
 async def root():
-    return {"message": "Flight Energy Simulation API", "version": "1.0.0"}
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "elevation_service": "ready_for_implementation"}
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
-@app.get("/api/vehicles", response_model=List[dict])
-async def get_vehicles():
-    """Verfügbare Fahrzeugtypen abrufen"""
-    return [
-        {
-            "type": "multirotor",
-            "name": "Multirotor",
-            "description": "Multirotor-Fahrzeuge (Tri/Quad/Hexa/Octo)",
-            "default_params": {
-                "vehicle_type": "multirotor",
-                "mass": 25,  # kg
-                "max_power": 10000,  # W
-                "hover_power": 3500,  # W
-                "hover_power_per_kg": 140,  # W/kg (25kg × 140 = 3500W)
-                "cruise_speed": 15,  # m/s
-                "max_speed": 17.5,  # m/s
-                "max_climb_rate": 6,  # m/s
-                "max_descent_speed": 2.5,  # m/s
-                "horizontal_acceleration": 4.0,  # m/s²
-                "vertical_acceleration": 3.0,  # m/s²
-                "battery_capacity": 66000,  # mAh
-                "battery_voltage": 47.8,  # V
-                "frame_type": "quad",
-                "motor_config": "coaxial",  # Coaxial für bessere Leistung
-                "rotor_diameter": 0.7,  # m
-                "drag_coefficient": 0.43
-            }
-        },
-        {
-            "type": "vtol",
-            "name": "VTOL",
-            "description": "Vertical Take-Off and Landing",
-            "default_params": {
-                "vehicle_type": "vtol",
-                "mass": 5.0,  # kg
-                "max_power": 2000,  # W
-                "hover_power": 800,  # W
-                "hover_power_per_kg": 160,  # W/kg (5kg × 160 = 800W)
-                "cruise_power": 600,  # W
-                "forward_thrust_power": 500,  # W
-                "cruise_speed": 18,  # m/s
-                "max_speed": 25,  # m/s
-                "max_climb_rate": 8,  # m/s
-                "max_descent_speed": 6,  # m/s
-                "horizontal_acceleration": 3.0,  # m/s²
-                "vertical_acceleration": 4.0,  # m/s²
-                "battery_capacity": 10000,  # mAh
-                "battery_voltage": 44.4,  # V
-                "frame_type": "quad",
-                "motor_config": "single", 
-                "vtol_config": "quad_plane",
-                "rotor_diameter": 0.3,  # m
-                "wing_area": 0.5,  # m²
-                "drag_coefficient": 0.05
-            }
-        },
-        {
-            "type": "plane",
-            "name": "Fixed Wing",
-            "description": "Starrflügelflugzeug",
-            "default_params": {
-                "vehicle_type": "plane",
-                "mass": 3.0,  # kg
-                "max_power": 800,  # W
-                "cruise_power": 300,  # W
-                "stall_speed": 12,  # m/s
-                "cruise_speed": 22,  # m/s
-                "max_speed": 30,  # m/s
-                "max_climb_rate": 10,  # m/s
-                "max_descent_speed": 8,  # m/s
-                "horizontal_acceleration": 2.0,  # m/s²
-                "vertical_acceleration": 5.0,  # m/s²
-                "battery_capacity": 8000,  # mAh
-                "battery_voltage": 22.2,  # V
-                "wing_area": 0.4,  # m²
-                "drag_coefficient": 0.025
-            }
+# Fahrzeugtypen sind statisch
+_VEHICLES = [
+    {
+        "type": "multirotor",
+        "name": "Multirotor",
+        "description": "Multirotor-Fahrzeuge (Tri/Quad/Hexa/Octo)",
+        "default_params": {
+            "vehicle_type": "multirotor",
+            "mass": 25,  # kg
+            "max_power": 10000,  # W
+            "hover_power": 3500,  # W
+            "hover_power_per_kg": 140,  # W/kg (25kg × 140 = 3500W)
+            "cruise_speed": 15,  # m/s
+            "max_speed": 17.5,  # m/s
+            "max_climb_rate": 6,  # m/s
+            "max_descent_speed": 2.5,  # m/s
+            "horizontal_acceleration": 4.0,  # m/s²
+            "vertical_acceleration": 3.0,  # m/s²
+            "battery_capacity": 66000,  # mAh
+            "battery_voltage": 47.8,  # V
+            "frame_type": "quad",
+            "motor_config": "coaxial",  # Coaxial für bessere Leistung
+            "rotor_diameter": 0.7,  # m
+            "drag_coefficient": 0.43
+        }
+    },
+    {
+        "type": "vtol",
+        "name": "VTOL",
+        "description": "Vertical Take-Off and Landing",
+        "default_params": {
+            "vehicle_type": "vtol",
+            "mass": 5.0,  # kg
+            "max_power": 2000,  # W
+            "hover_power": 800,  # W
+            "hover_power_per_kg": 160,  # W/kg (5kg × 160 = 800W)
+            "cruise_power": 600,  # W
+            "forward_thrust_power": 500,  # W
+            "cruise_speed": 18,  # m/s
+            "max_speed": 25,  # m/s
+            "max_climb_rate": 8,  # m/s
+            "max_descent_speed": 6,  # m/s
+            "horizontal_acceleration": 3.0,  # m/s²
+            "vertical_acceleration": 4.0,  # m/s²
+            "battery_capacity": 10000,  # mAh
+            "battery_voltage": 44.4,  # V
+            "frame_type": "quad",
+            "motor_config": "single", 
+            "vtol_config": "quad_plane",
+            "rotor_diameter": 0.3,  # m
+            "wing_area": 0.5,  # m²
+            "drag_coefficient": 0.05
         }
-    ]
+    },
+    {
+        "type": "plane",
+        "name": "Fixed Wing",
+        "description": "Starrflügelflugzeug",
+        "default_params": {
+            "vehicle_type": "plane",
+            "mass": 3.0,  # kg
+            "max_power": 800,  # W
+            "cruise_power": 300,  # W
+            "stall_speed": 12,  # m/s
+            "cruise_speed": 22,  # m/s
+            "max_speed": 30,  # m/s
+            "max_climb_rate": 10,  # m/s
+            "max_descent_speed": 8,  # m/s
+            "horizontal_acceleration": 2.0,  # m/s²
+            "vertical_acceleration": 5.0,  # m/s²
+            "battery_capacity": 8000,  # mAh
+            "battery_voltage": 22.2,  # V
+            "wing_area": 0.4,  # m²
+            "drag_coefficient": 0.025
+        }
+    }
+]
+_VEHICLES_JSON = orjson.dumps(_VEHICLES)
+# Bereits komprimiert, damit die GZip-Middleware die statische Antwort nicht jedes Mal neu packt
+_VEHICLES_JSON_GZIP = gzip.compress(_VEHICLES_JSON)
+
+@app.get("/api/vehicles")
+async def get_vehicles(request: Request):
+    """Verfügbare Fahrzeugtypen abrufen"""
+    # Umgeht die GZip-Middleware bewusst: die Liste (~1,4 KB) liegt über minimum_size und
+    # würde sonst bei jeder Anfrage neu gepackt. Eine gesetzte Content-Encoding lässt die
+    # Middleware die Antwort unverändert durchreichen.
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=_VEHICLES_JSON_GZIP,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(content=_VEHICLES_JSON, media_type="application/json",
+                     headers={"Vary": "Accept-Encoding"})
+
+def _inline_schema(model) -> dict:
+    """JSON-Schema eines Modells mit aufgelösten $defs (für openapi_extra)"""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+    return resolve(schema)
 
-@app.post("/api/simulation", response_model=SimulationResult)
+@app.post(
+    "/api/simulation",
+    response_model=SimulationResult,
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _inline_schema(SimulationRequest)}}
+    }}
+)
 async def run_simulation(
-    request: SimulationRequest, 
+    http_request: Request,
     db=Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Energiesimulation durchführen"""
+    # Body direkt mit pydantic-core aus JSON validieren (ohne Umweg über json.loads-Dicts,
+    # bei langen Waypoint-Listen der größte Teil der Request-Verarbeitung)
+    try:
+        request = SimulationRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)
+        ])
+    
     try:
-        print(f"DEBUG: Request received: {type(request)}")
-        print(f"DEBUG: Has vehicle_config: {hasattr(request, 'vehicle_config')}")
-        if hasattr(request, 'vehicle_config'):
-            print(f"DEBUG: vehicle_config type: {type(request.vehicle_config)}")
-            print(f"DEBUG: Has vehicle_type: {hasattr(request.vehicle_config, 'vehicle_type')}")
+        logger.debug("Simulation request: vehicle_type=%s, waypoints=%d",
+                     request.vehicle_config.vehicle_type, len(request.waypoints))
         
         # Wind data für alle Waypoints abrufen
         wind_data = []
         
         # Prüfen ob manueller Wind aktiviert ist
         if request.manual_wind_enabled and request.manual_wind_speed_ms is not None and request.manual_wind_direction_deg is not None:
-            print(f"DEBUG: Using manual wind - Speed: {request.manual_wind_speed_ms} m/s, Direction: {request.manual_wind_direction_deg}°")
+            logger.debug("Using manual wind - speed: %s m/s, direction: %s°",
+                         request.manual_wind_speed_ms, request.manual_wind_direction_deg)
             # Manuelle Winddaten für alle Waypoints erstellen
-            for waypoint in request.waypoints:
-                wind = wind_service.create_manual_wind_data(
-                    latitude=waypoint.latitude,
-                    longitude=waypoint.longitude, 
-                    altitude=waypoint.altitude,
-                    wind_speed_ms=request.manual_wind_speed_ms,
-                    wind_direction_deg=request.manual_wind_direction_deg
-                )
-                wind_data.append(wind)
+            wind_data = wind_service.create_manual_wind_data_batch(
+                request.waypoints,
+                wind_speed_ms=request.manual_wind_speed_ms,
+                wind_direction_deg=request.manual_wind_direction_deg
+            )
         else:
-            print("DEBUG: Using automatic wind data")
-            # Automatische Winddaten für alle Waypoints abrufen
-            for waypoint in request.waypoints:
-                wind = await wind_service.get_wind_data(
-                    waypoint.latitude, waypoint.longitude, waypoint.altitude
-                )
-                wind_data.append(wind)
+            logger.debug("Using automatic wind data")
+            # Automatische Winddaten für alle Waypoints in einer Sammelabfrage abrufen
+            wind_data = await wind_service.get_wind_data_batch([
+                (waypoint.latitude, waypoint.longitude, waypoint.altitude)
+                for waypoint in request.waypoints
+            ])
         
-        # Energieberechnung durchführen
-        result = energy_calculator.calculate_energy_consumption(
+        # Energieberechnung im Threadpool durchführen, damit die CPU-Arbeit den Event-Loop nicht blockiert
+        result = await asyncio.to_thread(
+            energy_calculator.calculate_energy_consumption,
             config=request.vehicle_config,
             waypoints=request.waypoints,
             wind_data=wind_data
         )
         
-        # Session speichern
-        session = session_service.create_session(
+        # Session speichern (blockierender DB-Zugriff im Threadpool)
+        session = await asyncio.to_thread(
+            session_service.create_session,
             db=db,
             simulation_request=request,
             simulation_result=result,
@@ -224,61 +341,16 @@ async def run_simulation(
         )
         
         result.session_id = session.id
-        return result
-        
-    except Exception as e:
-        import traceback
-        print(f"ERROR in simulation: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.get("/api/wind/{lat}/{lon}/{alt}")
-async def get_wind_data(lat: float, lon: float, alt: float, hours_ahead: int = 0):
-    """Winddaten für eine Position abrufen"""
-    try:
-        if hours_ahead > 0:
-            wind_data = await wind_service.get_wind_forecast(lat, lon, alt, hours_ahead)
-        else:
-            wind_data = await wind_service.get_wind_data(lat, lon, alt)
-        return wind_data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/api/wind/route")
-async def get_wind_vectors_for_route(request: dict):
-    """Windvektoren für eine gesamte Route abrufen"""
-    try:
-        waypoints = request.get('waypoints', [])
-        mission_start_time = request.get('mission_start_time')  # ISO format string
-        flight_duration = request.get('flight_duration', 1.0)  # hours
-        
-        # Parse start time if provided
-        start_time = None
-        if mission_start_time:
-            from datetime import datetime
-            start_time = datetime.fromisoformat(mission_start_time.replace('Z', '+00:00'))
-        
-        # Convert waypoints to expected format
-        wp_list = []
-        for wp in waypoints:
-            wp_list.append({
-                'lat': wp.get('latitude', 0.0),
-                'lon': wp.get('longitude', 0.0), 
-                'alt': wp.get('altitude', 100.0)
-            })
+        # response_model bleibt für die API-Doku; das Ergebnis direkt serialisieren,
+        # statt es von FastAPI ein zweites Mal validieren zu lassen
+        return ORJSONResponse(result.model_dump())
         
-        wind_vectors = await wind_service.get_wind_vectors_for_route(
-            waypoints=wp_list,
-            mission_start_time=start_time,
-            flight_duration_estimate=flight_duration
-        )
-        
-        return {"wind_vectors": wind_vectors}
     except Exception as e:
+        logger.exception("Simulation failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/sessions")
-async def create_session(
+def create_session(
     name: str, 
     description: Optional[str] = None, 
     db=Depends(get_db),
@@ -286,74 +358,39 @@ async def create_session(
 ):
     """Neue Session erstellen (leere Session für manuelle Erstellung)"""
     # Erstelle eine minimale Session ohne Simulationsdaten
-    from datetime import datetime
+    session = SimulationSession(
+        name=name,
+        description=description or "Manuell erstellte Session",
+        owner_id=current_user.id
+    )
+    db.add(session)
+    db.commit()
+    db.refresh(session)
     
-    db_session = SessionLocal()
-    try:
-        from models.database import SimulationSession
-        session = SimulationSession(
-            name=name,
-            description=description or "Manuell erstellte Session",
-            owner_id=current_user.id
-        )
-        db_session.add(session)
-        db_session.commit()
-        db_session.refresh(session)
-        
-        return {"session_id": session.id, "name": session.name}
-    finally:
-        db_session.close()
+    return {"session_id": session.id, "name": session.name}
 
-@app.get("/api/sessions")
-async def get_sessions(
+@app.get("/api/sessions", response_model=List[SessionSummary])
+def get_sessions(
     db=Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Alle Sessions abrufen (nur eigene und Gruppen-Sessions)"""
-    from services.group_service import can_access_session
-    
-    all_sessions = session_service.get_all_sessions(db)
-    # Filter sessions based on user access
-    accessible_sessions = []
-    for session in all_sessions:
-        # SQLAlchemy objects - use direct attribute access
-        if session.owner_id == current_user.id or can_access_session(db, session.id, current_user):
-            # Convert to dict for JSON response
-            session_dict = {
-                "id": session.id,
-                "name": session.name,
-                "description": session.description,
-                "vehicle_type": session.vehicle_type,
-                "total_energy_wh": session.total_energy_wh,
-                "total_distance_m": session.total_distance_m,
-                "total_time_s": session.total_time_s,
-                "battery_usage_percent": session.battery_usage_percent,
-                "created_at": session.created_at.isoformat() if session.created_at else None,
-                "owner_id": session.owner_id
-            }
-            accessible_sessions.append(session_dict)
-    
-    return accessible_sessions
+    return session_service.get_accessible_sessions(db, current_user)
 
 @app.get("/api/sessions/{session_id}")
-async def get_session(
+def get_session(
     session_id: int, 
     db=Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Spezifische Session abrufen"""
-    from services.group_service import can_access_session
-    
-    if not can_access_session(db, session_id, current_user):
-        raise HTTPException(status_code=403, detail="Access denied")
-    
     session = session_service.get_session(db, session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    if not session or not can_access_loaded_session(db, session, current_user):
+        raise HTTPException(status_code=403, detail="Access denied")
     return session
 
 @app.get("/api/sessions/{session_id}/restore")
-async def restore_session(session_id: int, db=Depends(get_db)):
+def restore_session(session_id: int, db=Depends(get_db)):
     """Session vollständig wiederherstellen für Simulation-Tab"""
     try:
         restored_data = session_service.restore_simulation_data(db, session_id)
@@ -364,7 +401,7 @@ async def restore_session(session_id: int, db=Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error restoring session: {str(e)}")
 
 @app.put("/api/sessions/{session_id}/name")
-async def update_session_name(session_id: int, request: dict, db=Depends(get_db)):
+def update_session_name(session_id: int, request: dict, db=Depends(get_db)):
     """Session-Namen aktualisieren"""
     try:
         new_name = request.get("name")
@@ -380,7 +417,7 @@ async def update_session_name(session_id: int, request: dict, db=Depends(get_db)
         raise HTTPException(status_code=500, detail=f"Error updating session name: {str(e)}")
 
 @app.delete("/api/sessions/{session_id}")
-async def delete_session(session_id: int, db=Depends(get_db)):
+def delete_session(session_id: int, db=Depends(get_db)):
     """Session löschen"""
     try:
         success = session_service.delete_session(db, session_id)
@@ -393,36 +430,38 @@ async def delete_session(session_id: int, db=Depends(get_db)):
 
 # Elevation API Endpoints
 @app.post("/api/elevation/profile")
-async def get_elevation_profile(request: dict):
+async def get_elevation_profile(request: ElevationProfileRequest):
     """Generate elevation profile for a route"""
     try:
-        waypoints = request.get('waypoints', [])
-        interpolation_distance = request.get('interpolation_distance', 50.0)
-        
-        if len(waypoints) < 2:
+        if len(request.waypoints) < 2:
             raise HTTPException(status_code=400, detail="At least 2 waypoints required")
         
-        # Validate waypoints
-        for i, wp in enumerate(waypoints):
-            required_fields = ['latitude', 'longitude', 'altitude']
-            for field in required_fields:
-                if field not in wp:
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Waypoint {i} missing required field: {field}"
-                    )
-        
         elevation_service = get_elevation_service()
         profile = await elevation_service.generate_elevation_profile(
-            waypoints, interpolation_distance
+            [wp.model_dump() for wp in request.waypoints], request.interpolation_distance
         )
         
         return profile
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating elevation profile: {str(e)}")
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    if os.getenv("DEV") == "1":
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # Schema einmal im Hauptprozess anlegen - Worker überspringen den Schritt
+        init_db()
+        os.environ["SKIP_DB_INIT"] = "1"
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("UVICORN_WORKERS", "4")),
+            loop="uvloop",
+            http="httptools"
+        )
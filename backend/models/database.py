@@ -1,17 +1,92 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean, JSON
+from sqlalchemy import create_engine, event, inspect, text, Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean, JSON, Index, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.sql import func
+import orjson
 import os
+import zlib
 
 # Database URL from environment variable
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./simulation.db")
 
+# Wie stdlib json: Nicht-String-Schlüssel (z.B. int) als String speichern statt TypeError
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def _orjson_dumps(value) -> str:
+    """JSON-Spalten mit orjson serialisieren (SQLAlchemy erwartet einen str)"""
+    return orjson.dumps(value, option=ORJSON_OPTIONS).decode()
+
+# JSON-Spalten (Waypoints, Simulationsergebnis) über orjson statt stdlib json
+json_options = {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+
+# Verbindungs-Pool: 20 + 20 Overflow deckt die 40 Threads des FastAPI-Threadpools ab
+pool_options = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+}
+
 # Create engine
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    sqlite_options = {"connect_args": {"check_same_thread": False}}
+    sqlite_in_memory = DATABASE_URL in ("sqlite://", "sqlite:///:memory:")
+    if sqlite_in_memory:
+        # In-Memory-DB existiert nur pro Verbindung - alle Threads teilen eine
+        sqlite_options["poolclass"] = StaticPool
+    else:
+        # Datei-DB nutzt QueuePool (Standard nur 5 + 10 Verbindungen)
+        sqlite_options.update(pool_options)
+    engine = create_engine(DATABASE_URL, **sqlite_options, **json_options)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """SQLite-Verbindung beim Öffnen konfigurieren"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB Page-Cache
+        if not sqlite_in_memory:
+            # WAL: Leser blockieren Schreiber nicht (mehrere Worker-Prozesse)
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 else:
-    engine = create_engine(DATABASE_URL)
+    # Pool für parallele Worker-Threads; kompilierte Statements bleiben im Cache
+    engine = create_engine(
+        DATABASE_URL,
+        **pool_options,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        query_cache_size=1200,
+        **json_options,
+    )
+
+class CompressedJSON(TypeDecorator):
+    """JSON-Wert als zlib-komprimiertes orjson-Blob speichern
+
+    Das Simulationsergebnis enthält alle Flugsegmente und ist sehr repetitiv -
+    komprimiert belegt es etwa ein Fünftel des Platzes. Ältere Zeilen, die noch
+    als unkomprimiertes JSON gespeichert sind, werden weiterhin gelesen.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.compress(orjson.dumps(value, option=ORJSON_OPTIONS), 1)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, (dict, list)):
+            return value
+        if isinstance(value, str):
+            return orjson.loads(value)
+        value = bytes(value)
+        if value[:1] in (b"{", b"["):
+            return orjson.loads(value)
+        return orjson.loads(zlib.decompress(value))
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -21,6 +96,10 @@ Base = declarative_base()
 
 class SimulationSession(Base):
     __tablename__ = "simulation_sessions"
+    __table_args__ = (
+        # Session-Liste: Filter nach Besitzer, sortiert nach Erstellzeit
+        Index("ix_sessions_owner_created", "owner_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
@@ -40,7 +119,7 @@ class SimulationSession(Base):
     waypoints = Column(JSON)       # Waypoint-Liste als JSON
     wind_settings = Column(JSON)   # Wind-Einstellungen als JSON
     elevation_settings = Column(JSON)  # Elevation-Einstellungen als JSON (simulation-specific)
-    simulation_result = Column(JSON)  # Vollständiges SimulationResult als JSON
+    simulation_result = Column(CompressedJSON)  # Vollständiges SimulationResult (komprimiert)
     
     # Relation zu Flight Segments für detaillierte Abfrage
     flight_segments = relationship("FlightSegment", back_populates="session", cascade="all, delete-orphan")
@@ -53,7 +132,7 @@ class FlightSegment(Base):
     __tablename__ = "flight_segments"
     
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("simulation_sessions.id"))
+    session_id = Column(Integer, ForeignKey("simulation_sessions.id"), index=True)
     segment_id = Column(Integer)
     
     # Waypoint Daten
@@ -78,3 +157,34 @@ class FlightSegment(Base):
     total_wind_speed = Column(Float)
     
     session = relationship("SimulationSession", back_populates="flight_segments")
+
+
+def init_db():
+    """Erstellt alle Tabellen (idempotent) - einmalig vor dem Serverstart ausführen"""
+    # Alle Modelle importieren, damit ihre Tabellen in Base.metadata registriert sind
+    import models.user  # noqa: F401
+    Base.metadata.create_all(bind=engine)
+    # create_all legt Indizes nur für neue Tabellen an - bestehende DBs nachziehen
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    _migrate_simulation_result_column()
+
+
+def _migrate_simulation_result_column():
+    """simulation_result von JSON auf bytea umstellen (nur PostgreSQL, idempotent)
+
+    Bestehende Zeilen bleiben unkomprimiertes JSON - CompressedJSON liest beide Formate.
+    SQLite speichert Spalten typlos und braucht keine Migration.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    columns = inspect(engine).get_columns("simulation_sessions")
+    column = next((c for c in columns if c["name"] == "simulation_result"), None)
+    if column is None or not isinstance(column["type"], JSON):
+        return
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE simulation_sessions ALTER COLUMN simulation_result TYPE bytea "
+            "USING convert_to(simulation_result::text, 'UTF8')"
+        ))
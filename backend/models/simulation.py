@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 from models.vehicles import VehicleType, VehicleConfig
 from models.waypoint import Waypoint
 
@@ -40,3 +41,19 @@ class SimulationResult(BaseModel):
     
     class Config:
         from_attributes = True
+
+class SessionSummary(BaseModel):
+    """Kurzfassung einer gespeicherten Session für die Session-Liste"""
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    vehicle_type: Optional[str] = None
+    total_energy_wh: Optional[float] = None
+    total_distance_m: Optional[float] = None
+    total_time_s: Optional[float] = None
+    battery_usage_percent: Optional[float] = None
+    created_at: Optional[datetime] = None
+    owner_id: Optional[int] = None
+    
+    class Config:
+        from_attributes = True
@@ -23,6 +23,14 @@ class VTOLConfiguration(str, Enum):
     TILT_WING = "tilt_wing"         # Ganze Flügel kippen
     TAIL_SITTER = "tail_sitter"     # Startet/landet auf dem Heck
 
+# Basis Motor-Anzahl pro Frame (einmalig statt bei jeder Validierung aufbauen)
+BASE_MOTORS_PER_FRAME = {
+    FrameType.TRI: 3,
+    FrameType.QUAD: 4,
+    FrameType.HEXA: 6,
+    FrameType.OCTO: 8
+}
+
 class VehicleConfig(BaseModel):
     # Typ des Fahrzeugs
     vehicle_type: VehicleType  # multirotor, vtol, plane
@@ -67,25 +75,18 @@ class VehicleConfig(BaseModel):
     def calculate_motor_counts(self):
         """Berechne Motor-Anzahl basierend auf Frame und Configuration"""
         if self.frame_type and self.motor_config:
-            # Basis Motor-Anzahl pro Frame
-            base_motors = {
-                FrameType.TRI: 3,
-                FrameType.QUAD: 4, 
-                FrameType.HEXA: 6,
-                FrameType.OCTO: 8
-            }
-            
-            self.hover_motors_count = base_motors.get(self.frame_type, 4)
+            hover_motors_count = BASE_MOTORS_PER_FRAME.get(self.frame_type, 4)
             
             # Bei Coaxial doppelte Anzahl
             if self.motor_config == MotorConfiguration.COAXIAL:
-                self.hover_motors_count *= 2
-            
-            self.total_motors_count = self.hover_motors_count
+                hover_motors_count *= 2
             
             # Bei VTOL zusätzlich Forward-Thrust Motor(en)
-            if self.vtol_config:
-                if self.vtol_config in [VTOLConfiguration.QUAD_PLANE]:
-                    self.total_motors_count += 1  # Ein Vortriebsmotor
+            total_motors_count = hover_motors_count
+            if self.vtol_config == VTOLConfiguration.QUAD_PLANE:
+                total_motors_count += 1  # Ein Vortriebsmotor
+            
+            self.hover_motors_count = hover_motors_count
+            self.total_motors_count = total_motors_count
         
         return self
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import List, Optional
+from datetime import datetime
 
 class Waypoint(BaseModel):
     latitude: float  # WGS84
@@ -14,6 +15,15 @@ class WaypointPlan(BaseModel):
     description: Optional[str] = None
     waypoints: List[Waypoint]
     
+class RouteWindRequest(BaseModel):
+    waypoints: List[Waypoint]
+    mission_start_time: Optional[datetime] = None  # ISO-Format, None = jetzt
+    flight_duration: float = 1.0  # Stunden
+
+class ElevationProfileRequest(BaseModel):
+    waypoints: List[Waypoint]
+    interpolation_distance: float = 50.0  # m
+    
 class WindData(BaseModel):
     latitude: float
     longitude: float
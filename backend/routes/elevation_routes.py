@@ -4,71 +4,62 @@ Elevation Settings Routes - API endpoints for user elevation settings
 Copyright (C) 2025 wolkstein
 """
 
+import logging
+
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
-from models.database import SessionLocal
 from models.user import User, ElevationSettings, ElevationSettingsUpdate
 
-# Import auth service - use SAME auth as sessions
-from services.auth_service import get_current_active_user
+# Import auth service - use SAME auth and DB session as sessions, so
+# current_user is already attached to the request's session
+from services.auth_service import get_current_active_user, get_db
 
 router = APIRouter(prefix="/api/elevation", tags=["elevation"])
 
-# Database dependency
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+logger = logging.getLogger(__name__)
 
 # User Elevation Settings Endpoints
 @router.get("/settings", response_model=ElevationSettings)
-async def get_user_elevation_settings(
+def get_user_elevation_settings(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get current user's elevation settings"""
     try:
-        # Get user from current session by ID
-        user = db.query(User).filter(User.id == current_user.id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
+        user = current_user
         
-        print(f"🔍 DEBUG: User {user.username} elevation_settings: {user.elevation_settings}")
+        logger.debug("User %s elevation_settings: %s", user.username, user.elevation_settings)
         
         if user.elevation_settings:
-            print(f"✅ Returning user settings: {user.elevation_settings}")
+            logger.debug("Returning user settings: %s", user.elevation_settings)
             return ElevationSettings(**user.elevation_settings)
         else:
-            print("⚠️ No user settings found, returning defaults")
+            logger.debug("No user settings found, returning defaults")
             # Return defaults if no settings exist
             return ElevationSettings()
             
     except Exception as e:
-        print(f"❌ Error in get_user_elevation_settings: {e}")
+        logger.exception("Error in get_user_elevation_settings")
         raise HTTPException(status_code=500, detail=f"Error loading settings: {str(e)}")
 
 @router.put("/settings", response_model=ElevationSettings)
-async def update_user_elevation_settings(
+def update_user_elevation_settings(
     settings_update: ElevationSettingsUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Update current user's elevation settings"""
     try:
-        print(f"🔄 DEBUG: PUT request - updating settings: {settings_update}")
+        logger.debug("PUT request - updating settings: %s", settings_update)
         
-        # Get user from current session by ID  
-        user = db.query(User).filter(User.id == current_user.id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
+        user = current_user
             
-        print(f"🔍 DEBUG: User {user.username} current settings: {user.elevation_settings}")
+        logger.debug("User %s current settings: %s", user.username, user.elevation_settings)
             
-        # Get current settings or defaults
-        current_settings = user.elevation_settings or {}
+        # Get current settings or defaults (copy - the new dict is assigned below,
+        # so SQLAlchemy sees the JSON column as changed)
+        current_settings = dict(user.elevation_settings or {})
         
         # Update only provided fields
         if settings_update.opentopo_server is not None:
@@ -78,22 +69,17 @@ async def update_user_elevation_settings(
         if settings_update.safety_margin_m is not None:
             current_settings["safety_margin_m"] = settings_update.safety_margin_m
             
-        print(f"💾 DEBUG: Saving new settings: {current_settings}")
+        logger.debug("Saving new settings: %s", current_settings)
             
         # Save to database
         user.elevation_settings = current_settings
         db.commit()
         
-        # Force complete reload from database (avoid SQLAlchemy cache)
-        user_id = user.id
-        db.expunge(user)  # Remove from session
-        user = db.query(User).filter(User.id == user_id).first()  # Fresh load
-        
-        print(f"✅ DEBUG: Settings saved successfully. Verification: {user.elevation_settings}")
+        logger.debug("Settings saved successfully: %s", current_settings)
         
         return ElevationSettings(**current_settings)
         
     except Exception as e:
-        print(f"❌ Error in update_user_elevation_settings: {e}")
+        logger.exception("Error in update_user_elevation_settings")
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error updating settings: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Wind API Routes
+Copyright (C) 2025 wolkstein
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from models.waypoint import RouteWindRequest
+from services.wind_service import WindService
+
+router = APIRouter(prefix="/api/wind", tags=["wind"])
+
+async def get_wind_service(request: Request) -> WindService:
+    """Shared WindService (and its HTTP client) from the app state
+    
+    async, so FastAPI does not hop to the threadpool for this trivial lookup.
+    """
+    return request.app.state.wind_service
+
+@router.get("/{lat}/{lon}/{alt}")
+async def get_wind_data(lat: float, lon: float, alt: float, hours_ahead: int = 0,
+                        wind_service: WindService = Depends(get_wind_service)):
+    """Winddaten für eine Position abrufen"""
+    try:
+        if hours_ahead > 0:
+            wind_data = await wind_service.get_wind_forecast(lat, lon, alt, hours_ahead)
+        else:
+            wind_data = await wind_service.get_wind_data(lat, lon, alt)
+        return wind_data
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/route")
+async def get_wind_vectors_for_route(request: RouteWindRequest,
+                                     wind_service: WindService = Depends(get_wind_service)):
+    """Windvektoren für eine gesamte Route abrufen"""
+    try:
+        wp_list = [
+            {'lat': wp.latitude, 'lon': wp.longitude, 'alt': wp.altitude}
+            for wp in request.waypoints
+        ]
+        
+        wind_vectors = await wind_service.get_wind_vectors_for_route(
+            waypoints=wp_list,
+            mission_start_time=request.mission_start_time,
+            flight_duration_estimate=request.flight_duration
+        )
+        
+        return {"wind_vectors": wind_vectors}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -9,13 +9,19 @@ the Free Software Foundation, either version 3 of the License, or
 (at your option) any later version.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+import asyncio
 import hashlib
-from jose import JWTError, jwt
+import threading
+import time
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-from fastapi import Depends, HTTPException, status
+from fastapi import BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from models.database import SessionLocal
@@ -26,19 +32,35 @@ SECRET_KEY = "your-secret-key-here-change-in-production"  # Change this in produ
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24  # 30 days for simplicity
 
+# Signing key and accepted algorithms are built once instead of per token
+JWT_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+JWT_ALGORITHMS = [ALGORITHM]
+
+# Decoded tokens are cached briefly so repeated requests skip JWT verification
+TOKEN_CACHE_TTL_S = 60
+TOKEN_CACHE_MAX_ENTRIES = 10000
+# last_login is only written when the stored value is older than this
+LAST_LOGIN_UPDATE_INTERVAL = timedelta(minutes=5)
+
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # HTTP Bearer for token authentication
 security = HTTPBearer()
 
-def get_db():
-    """Database dependency"""
+# LRU cache: token -> (cache expiry, username)
+_token_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+# Sync dependencies run in the threadpool, so cache access is locked
+_token_cache_lock = threading.Lock()
+
+async def get_db():
+    """Database dependency (async, so opening the session needs no threadpool hop)"""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        # Returning the connection to the pool may hit the database
+        await asyncio.to_thread(db.close)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -56,7 +78,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, JWT_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
@@ -105,10 +127,15 @@ def create_user(db: Session, user_create: UserCreate) -> User:
     db.refresh(db_user)
     return db_user
 
+@lru_cache(maxsize=8192)
+def _username_salt(username_lower: str) -> str:
+    """Per-user salt (hex, as in the frontend) - fixed per username, so cached"""
+    return hashlib.sha256(username_lower.encode()).hexdigest()
+
 def generate_client_password_hash(password: str, username: str) -> str:
     """Generate the same hash as the frontend for client-hashed passwords"""
     # Use username as salt (same logic as frontend)
-    salt = hashlib.sha256(username.lower().encode()).hexdigest()
+    salt = _username_salt(username.lower())
     # Combine password with salt and hash
     password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
     return password_hash
@@ -148,28 +175,63 @@ def create_user_with_client_hash(db: Session, user_create: UserCreate) -> User:
             detail="Email already registered"
         )
     
-    # Store the client hash as provided (already hashed on client)
-    # Also create a server-side hash for additional security
-    server_side_hash = get_password_hash(user_create.password)
-    
+    # Store the client hash as provided (already hashed on client).
+    # For now, we'll store the client hash in the hashed_password field
+    # This is a simplified approach - in production you'd want separate fields
+    # (a server-side bcrypt hash was computed here before, but always discarded)
     db_user = User(
         username=user_create.username,
         email=user_create.email,
-        hashed_password=server_side_hash,
+        hashed_password=user_create.password,  # Store client hash directly
         # We need to add this field to the User model
         # client_password_hash=user_create.password  # This is already the client hash
     )
     
-    # For now, we'll store the client hash in the hashed_password field
-    # This is a simplified approach - in production you'd want separate fields
-    db_user.hashed_password = user_create.password  # Store client hash directly
-    
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
     return db_user
 
-async def get_current_user(
+def decode_token_username(token: str) -> Optional[str]:
+    """Return the token's subject, or None if the token is invalid or expired"""
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            if cached[0] > now:
+                _token_cache.move_to_end(token)
+                return cached[1]
+            del _token_cache[token]
+    
+    try:
+        payload = jwt.decode(token, JWT_KEY, algorithms=JWT_ALGORITHMS)
+    except JWTError:
+        return None
+    username = payload.get("sub")
+    if username is None:
+        return None
+    
+    # Never cache beyond the token's own expiry
+    expiry = now + TOKEN_CACHE_TTL_S
+    if payload.get("exp") is not None:
+        expiry = min(expiry, float(payload["exp"]))
+    with _token_cache_lock:
+        _token_cache[token] = (expiry, username)
+        while len(_token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.popitem(last=False)
+    return username
+
+def record_last_login(user_id: int, timestamp: datetime):
+    """Write last_login in its own session (runs after the response is sent)"""
+    db = SessionLocal()
+    try:
+        db.execute(update(User).where(User.id == user_id).values(last_login=timestamp))
+        db.commit()
+    finally:
+        db.close()
+
+def get_current_user(
+    background_tasks: BackgroundTasks,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -180,22 +242,22 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
+    username = decode_token_username(credentials.credentials)
+    if username is None:
         raise credentials_exception
     
     user = get_user_by_username(db, username)
     if user is None:
         raise credentials_exception
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    db.commit()
+    # Update last login (throttled, and written after the response so the
+    # request's own session is never committed or expired by authentication)
+    now = datetime.utcnow()
+    last_login = user.last_login
+    if last_login is not None and last_login.tzinfo is not None:
+        last_login = last_login.astimezone(timezone.utc).replace(tzinfo=None)
+    if last_login is None or now - last_login >= LAST_LOGIN_UPDATE_INTERVAL:
+        background_tasks.add_task(record_last_login, user.id, now)
     
     return user
 
@@ -7,6 +7,29 @@ Copyright (C) 2025 wolkstein
 import math
 from typing import List, Dict, Any
 import json
+import numpy as np
+from services.jit import njit
+
+EARTH_RADIUS_M = 6371000.0
+_DEG2RAD = math.pi / 180.0
+
+
+@njit(cache=True)
+def _haversine_kernel(lat1, lon1, lat2, lon2):
+    """Haversine Distanzen in Metern für Arrays von Punktpaaren (wie calculate_distance)"""
+    sin_half_dlat = np.sin((lat2 - lat1) * (_DEG2RAD * 0.5))
+    sin_half_dlon = np.sin((lon2 - lon1) * (_DEG2RAD * 0.5))
+    
+    a = (sin_half_dlat * sin_half_dlat +
+         np.cos(lat1 * _DEG2RAD) * np.cos(lat2 * _DEG2RAD) *
+         sin_half_dlon * sin_half_dlon)
+    return EARTH_RADIUS_M * 2.0 * np.arcsin(np.minimum(np.sqrt(a), 1.0))
+
+
+@njit(cache=True)
+def _mock_elevation_kernel(lat, lon):
+    """Mock elevation für Koordinaten-Arrays (wie get_mock_elevation)"""
+    return np.maximum(0.0, 100 + 50 * np.sin(lat * 10) + 30 * np.cos(lon * 15))
 
 
 class ElevationService:
@@ -18,19 +41,15 @@ class ElevationService:
     
     def calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Haversine Distanz zwischen zwei Punkten in Metern"""
-        R = 6371000  # Earth radius in meters
+        sin_half_dlat = math.sin((lat2 - lat1) * (_DEG2RAD * 0.5))
+        sin_half_dlon = math.sin((lon2 - lon1) * (_DEG2RAD * 0.5))
         
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+        a = (sin_half_dlat * sin_half_dlat +
+             math.cos(lat1 * _DEG2RAD) * math.cos(lat2 * _DEG2RAD) *
+             sin_half_dlon * sin_half_dlon)
         
-        a = (math.sin(delta_lat/2) * math.sin(delta_lat/2) + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * 
-             math.sin(delta_lon/2) * math.sin(delta_lon/2))
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        return R * c
+        # 2·asin(√a) ist gleichwertig zu 2·atan2(√a, √(1-a)), mit weniger Operationen
+        return EARTH_RADIUS_M * 2.0 * math.asin(min(1.0, math.sqrt(a)))
     
     def interpolate_points(self, lat1: float, lon1: float, lat2: float, lon2: float, 
                           distance_m: float = 50.0) -> List[Dict[str, float]]:
@@ -69,6 +88,10 @@ class ElevationService:
         elevation = 100 + 50 * math.sin(lat * 10) + 30 * math.cos(lon * 15)
         return max(0, elevation)  # Keine negativen Höhen
     
+    def get_mock_elevation_array(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Mock elevation für ganze Koordinaten-Arrays"""
+        return _mock_elevation_kernel(lat, lon)
+    
     async def generate_elevation_profile(self, waypoints: List[Dict[str, Any]], 
                                        interpolation_distance: float = 50.0) -> Dict[str, Any]:
         """Generiere Höhenprofil für eine Route"""
@@ -76,65 +99,86 @@ class ElevationService:
         if len(waypoints) < 2:
             raise ValueError("Mindestens 2 Waypoints erforderlich")
         
-        profile_points = []
-        cumulative_distance = 0.0
+        lat = np.array([wp['latitude'] for wp in waypoints], dtype=np.float64)
+        lon = np.array([wp['longitude'] for wp in waypoints], dtype=np.float64)
+        alt = np.array([wp['altitude'] for wp in waypoints], dtype=np.float64)
         
-        # Für jedes Segment zwischen Waypoints
-        for i in range(len(waypoints) - 1):
-            wp1 = waypoints[i] 
-            wp2 = waypoints[i + 1]
-            
-            # Punkte zwischen Waypoints interpolieren
-            segment_points = self.interpolate_points(
-                wp1['latitude'], wp1['longitude'],
-                wp2['latitude'], wp2['longitude'],
-                interpolation_distance
+        # Segmentdistanzen einmal für alle Segmente berechnen (Haversine)
+        segment_distance = _haversine_kernel(lat[:-1], lon[:-1], lat[1:], lon[1:])
+        segment_distance_km = segment_distance / 1000.0
+        
+        # Interpolationsanteile je Segment (wie interpolate_points); erster Punkt
+        # wird ab dem zweiten Segment übersprungen (Duplikat vermeiden)
+        ratio_parts = []
+        for i, distance in enumerate(segment_distance.tolist()):
+            if distance < interpolation_distance:
+                ratios = np.array([0.0, 1.0])
+            else:
+                num_points = int(distance / interpolation_distance)
+                ratios = np.arange(num_points + 1) / num_points
+            ratio_parts.append(ratios if i == 0 else ratios[1:])
+        
+        segment_index = np.repeat(np.arange(len(ratio_parts)), [len(r) for r in ratio_parts])
+        ratio = np.concatenate(ratio_parts)
+        
+        seg_lat1, seg_lat2 = lat[:-1][segment_index], lat[1:][segment_index]
+        seg_lon1, seg_lon2 = lon[:-1][segment_index], lon[1:][segment_index]
+        seg_alt1, seg_alt2 = alt[:-1][segment_index], alt[1:][segment_index]
+        seg_distance = segment_distance[segment_index]
+        
+        # Linear interpolation; kurze Segmente (< Interpolationsabstand) enden exakt auf dem Waypoint
+        segment_end = (seg_distance < interpolation_distance) & (ratio == 1.0)
+        point_lat = np.where(segment_end, seg_lat2, seg_lat1 + (seg_lat2 - seg_lat1) * ratio)
+        point_lon = np.where(segment_end, seg_lon2, seg_lon1 + (seg_lon2 - seg_lon1) * ratio)
+        point_distance_km = (seg_distance * ratio) / 1000.0
+        
+        # Waypoint altitude interpolieren
+        segment_progress = np.divide(
+            point_distance_km, segment_distance_km[segment_index],
+            out=np.zeros_like(point_distance_km), where=seg_distance > 0
+        )
+        waypoint_altitude = seg_alt1 + (seg_alt2 - seg_alt1) * segment_progress
+        
+        # Mock elevation data (später echte API) - wird lokal berechnet, ohne Upstream-Aufruf;
+        # ein Höhen-Cache lohnt sich erst im Client für die echte OpenTopo-API
+        terrain_elevation = self.get_mock_elevation_array(point_lat, point_lon)
+        clearance = waypoint_altitude - terrain_elevation
+        
+        # Kumulierte Distanz bis zum Segmentanfang
+        cumulative_km = np.cumsum(segment_distance_km)
+        cumulative_distance = float(cumulative_km[-1])
+        segment_offset_km = np.concatenate(([0.0], cumulative_km[:-1]))
+        profile_distance_km = segment_offset_km[segment_index] + point_distance_km
+        
+        profile_points = [
+            {
+                "distance_km": distance_km,
+                "lat": point_lat_value,
+                "lon": point_lon_value,
+                "terrain_elevation": terrain,
+                "waypoint_altitude": altitude,
+                "clearance": point_clearance
+            }
+            for distance_km, point_lat_value, point_lon_value, terrain, altitude, point_clearance in zip(
+                profile_distance_km.tolist(), point_lat.tolist(), point_lon.tolist(),
+                terrain_elevation.tolist(), waypoint_altitude.tolist(), clearance.tolist()
             )
-            
-            # Erste Punkt überspringen wenn nicht das erste Segment (Duplikat vermeiden)
-            start_idx = 1 if i > 0 else 0
-            
-            for point in segment_points[start_idx:]:
-                # Mock elevation data (später echte API)
-                terrain_elevation = self.get_mock_elevation(point['lat'], point['lon'])
-                
-                # Waypoint altitude interpolieren
-                segment_progress = point['distance_km'] / (self.calculate_distance(
-                    wp1['latitude'], wp1['longitude'], 
-                    wp2['latitude'], wp2['longitude']
-                ) / 1000.0) if self.calculate_distance(
-                    wp1['latitude'], wp1['longitude'], 
-                    wp2['latitude'], wp2['longitude']
-                ) > 0 else 0
-                
-                waypoint_altitude = wp1['altitude'] + (wp2['altitude'] - wp1['altitude']) * segment_progress
-                
-                profile_points.append({
-                    "distance_km": cumulative_distance + point['distance_km'],
-                    "lat": point['lat'],
-                    "lon": point['lon'], 
-                    "terrain_elevation": terrain_elevation,
-                    "waypoint_altitude": waypoint_altitude,
-                    "clearance": waypoint_altitude - terrain_elevation
-                })
-            
-            # Cumulative distance für nächstes Segment
-            if segment_points:
-                cumulative_distance += segment_points[-1]['distance_km']
+        ]
         
-        # Kollisionsanalyse
-        collisions = []
+        # Kollisionsanalyse: Indizes aus der Clearance-Maske, Werte aus den
+        # bereits aufgebauten Profilpunkten (kein zweiter Durchlauf über alle Punkte)
         safety_margin = 30.0  # Meter
-        
-        for point in profile_points:
-            if point['clearance'] < safety_margin:
-                collisions.append({
-                    "distance_km": point['distance_km'],
-                    "terrain_elevation": point['terrain_elevation'],
-                    "waypoint_altitude": point['waypoint_altitude'], 
-                    "clearance": point['clearance'],
-                    "safety_margin": safety_margin
-                })
+        collision_indices = np.flatnonzero(clearance < safety_margin).tolist()
+        collisions = [
+            {
+                "distance_km": profile_points[i]["distance_km"],
+                "terrain_elevation": profile_points[i]["terrain_elevation"],
+                "waypoint_altitude": profile_points[i]["waypoint_altitude"],
+                "clearance": profile_points[i]["clearance"],
+                "safety_margin": safety_margin
+            }
+            for i in collision_indices
+        ]
         
         return {
             "profile": {
@@ -17,13 +17,294 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import logging
 import math
-from typing import List, Dict, Any
-from models.vehicles import VehicleType, VehicleConfig, FrameType, MotorConfiguration
+from functools import lru_cache
+from typing import List, Dict, Any, NamedTuple
+from models.vehicles import VehicleType, VehicleConfig, FrameType, MotorConfiguration, BASE_MOTORS_PER_FRAME
 from models.waypoint import Waypoint, WindData
 from models.simulation import SimulationResult, FlightSegment
+from services.jit import njit
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371000.0
+GRAVITY = 9.81  # m/s²
+AIR_DENSITY_SEA_LEVEL = 1.225  # kg/m³
+
+@njit(cache=True)
+def _air_density_kernel(altitude):
+    """Luftdichte für ein Array von Höhen (wie calculate_air_density)"""
+    altitude = np.maximum(altitude, 0.0)
+    temperature = np.maximum(288.15 - 0.0065 * altitude, 200.0)
+    # (T/T0)^5.255 als exp(5.255 * ln(T/T0)) - günstiger als pow, gleiches Ergebnis bis auf Rundung
+    pressure_ratio = np.maximum(np.exp(5.255 * np.log(temperature / 288.15)), 0.01)
+    return np.maximum(AIR_DENSITY_SEA_LEVEL * pressure_ratio, 0.01)
+
+@njit(cache=True)
+def _haversine_3d_kernel(lat1, lon1, alt1, lat2, lon2, alt2):
+    """3D-Distanz in Metern zwischen zwei Punkten (Grad, Grad, Meter)"""
+    # Haversine Formel für horizontale Distanz
+    lat1, lon1 = math.radians(lat1), math.radians(lon1)
+    lat2, lon2 = math.radians(lat2), math.radians(lon2)
+    
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    c = 2 * math.asin(math.sqrt(max(0.0, a)))  # Sicherstellung, dass a nicht negativ ist
+    horizontal_distance = EARTH_RADIUS_M * c
+    
+    # 3D-Distanz mit Höhenunterschied
+    vertical_distance = alt2 - alt1
+    return math.hypot(horizontal_distance, vertical_distance)
+
+@njit(cache=True)
+def _route_geometry_kernel(lat, lon, alt):
+    """Horizontale/vertikale Distanz und Kurs aller Segmente (Waypoints in Grad)
+    
+    Returns:
+        (horizontal_distance_m, vertical_distance_m, flight_bearing_deg) je Segment
+    """
+    lat_rad = np.radians(lat)
+    lon_rad = np.radians(lon)
+    dlat = lat_rad[1:] - lat_rad[:-1]
+    dlon = lon_rad[1:] - lon_rad[:-1]
+    
+    # sin/cos der Breite einmal pro Waypoint - benachbarte Segmente teilen sich die Endpunkte
+    cos_lat = np.cos(lat_rad)
+    sin_lat = np.sin(lat_rad)
+    cos_lat1 = cos_lat[:-1]
+    cos_lat2 = cos_lat[1:]
+    
+    # Haversine Formel für horizontale Distanz
+    sin_half_dlon_sq = np.sin(dlon / 2) ** 2
+    a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * sin_half_dlon_sq
+    a = np.maximum(a, 0.0)
+    horizontal_distance = EARTH_RADIUS_M * (2 * np.arcsin(np.sqrt(a)))
+    vertical_distance = alt[1:] - alt[:-1]
+    
+    # Flugrichtung in Grad (0° = Norden, 90° = Osten)
+    # cos(dlon) = 1 - 2*sin²(dlon/2) - aus dem Haversine-Term, ohne weiteren cos-Aufruf
+    cos_dlon = 1.0 - 2.0 * sin_half_dlon_sq
+    flight_bearing_rad = np.arctan2(
+        np.sin(dlon) * cos_lat2,
+        cos_lat1 * sin_lat[1:] - sin_lat[:-1] * cos_lat2 * cos_dlon
+    )
+    flight_bearing_deg = (np.degrees(flight_bearing_rad) + 360) % 360
+    return horizontal_distance, vertical_distance, flight_bearing_deg
+
+@njit(cache=True)
+def _wind_components_kernel(flight_bearing_deg, wind_x, wind_y):
+    """Gegen- und Seitenwind relativ zur Flugrichtung für alle Segmente
+    
+    Returns:
+        (headwind_ms, crosswind_ms) je Segment, negativer Gegenwind = Rückenwind
+    """
+    flight_direction_x = np.sin(np.radians(flight_bearing_deg))  # Ost-West
+    flight_direction_y = np.cos(np.radians(flight_bearing_deg))  # Nord-Süd
+    headwind = -(wind_x * flight_direction_x + wind_y * flight_direction_y)
+    crosswind = wind_x * (-flight_direction_y) + wind_y * flight_direction_x
+    return headwind, crosswind
+
+@njit(cache=True)
+def _hover_power_kernel(air_density, mass, hover_power, rotor_diameter, hover_motors_count):
+    """Schwebeleistung je Segment (wie estimate_hover_power)
+    
+    Momentum Theory, falls keine hover_power konfiguriert ist.
+    """
+    if hover_power != 0:
+        return np.full_like(air_density, hover_power)
+    thrust_per_motor = mass * GRAVITY / max(1, hover_motors_count)
+    rotor_area = math.pi * (rotor_diameter / 2) ** 2
+    sqrt_arg = np.maximum(thrust_per_motor / (2 * np.maximum(air_density, 0.1) * rotor_area), 0.0)
+    return np.abs(thrust_per_motor * np.sqrt(sqrt_arg) / 0.7 * hover_motors_count)
+
+@njit(cache=True)
+def _multirotor_power_kernel(speed, climb_rate, air_density, has_wind, wind_x, wind_y, base_hover_power,
+                             mass, max_power, drag_coefficient, wing_area,
+                             motor_efficiency, propeller_efficiency):
+    """Multirotor-Leistung je Segment (wie calculate_multirotor_power)
+    
+    speed ist die Ground Speed; die Airspeed wird wie im Skalarpfad aus
+    dem Windvektor in X-Richtung abgeleitet. base_hover_power kommt aus
+    _hover_power_kernel.
+    """
+    speed = np.maximum(speed, 0.0)
+    air_density = np.maximum(air_density, 0.1)
+    effective_airspeed = np.where(has_wind, np.maximum(speed + wind_x, 0.1), speed)
+    
+    # Sweet-Spot-Effizienz (wie _calculate_speed_efficiency_factor)
+    sweet_spot_min = max(2.0, mass * 0.3)
+    sweet_spot_max = max(4.0, mass * 0.5)
+    sweet_spot_center = (sweet_spot_min + sweet_spot_max) / 2
+    normalized_pos = (effective_airspeed - sweet_spot_center) / (sweet_spot_max - sweet_spot_center)
+    speed_efficiency_factor = np.where(
+        effective_airspeed == 0, 1.0,
+        np.where(effective_airspeed <= sweet_spot_min,
+                 1.0 - ((effective_airspeed / sweet_spot_min) * 0.25) * 0.45,
+                 np.where(effective_airspeed <= sweet_spot_max,
+                          0.75 - (0.10 * 0.45) * (1 - normalized_pos ** 2),
+                          0.75 + np.minimum((effective_airspeed - sweet_spot_max) * 0.03, 0.4))))
+    
+    # Dynamischer Widerstandsbeiwert (wie _calculate_dynamic_drag_coefficient)
+    dynamic_cd = np.where(effective_airspeed <= 3.0, drag_coefficient,
+                          np.where(effective_airspeed <= 8.0, drag_coefficient * 0.9,
+                                   drag_coefficient * (1.0 + (effective_airspeed - 8.0) * 0.15)))
+    
+    # 0.5 * rho * Cd * A einmal pro Segment, gilt für Airspeed-, Ground-Speed- und Wind-Drag
+    drag_factor = 0.5 * air_density * dynamic_cd * wing_area
+    drive_efficiency = motor_efficiency * propeller_efficiency
+    drag_force = drag_factor * effective_airspeed ** 2
+    horizontal_power = drag_force * effective_airspeed / drive_efficiency
+    climb_power = (mass * GRAVITY * np.maximum(climb_rate, 0.0)) / motor_efficiency
+    
+    # Windeinfluss (wie _calculate_wind_power_impact)
+    wind_speed = np.hypot(wind_x, wind_y)
+    relative_speed = np.hypot(speed + wind_x, wind_y)
+    base_drag = drag_factor * speed ** 2
+    wind_drag = drag_factor * relative_speed ** 2
+    wind_power = np.where(
+        (wind_speed >= 0.1) & (speed >= 0.1),
+        np.minimum(np.abs(wind_drag - base_drag) * speed / drive_efficiency,
+                   base_drag * speed / drive_efficiency * 0.5),
+        0.0)
+    
+    total_power = (np.abs(base_hover_power * speed_efficiency_factor) + np.abs(horizontal_power)
+                   + np.abs(climb_power) + np.abs(wind_power))
+    return np.minimum(total_power, max_power)
+
+@njit(cache=True)
+def _vtol_cruise_power_kernel(speed, climb_rate, wind_x, wind_y, base_hover_power,
+                              mass, max_power, max_speed, forward_thrust_power, motor_efficiency):
+    """VTOL-Leistung im Cruise-Modus je Segment (wie calculate_vtol_power ab 5 m/s)
+    
+    Ohne Wind sind wind_x/wind_y Null, der Windanteil fällt dann ohne Verzweigung weg.
+    """
+    # Hover-Motoren für Auftrieb (reduziert bei Forward-Flight)
+    hover_power_factor = np.maximum(0.3, 1.0 - (speed / max_speed) * 0.7)
+    lift_power = base_hover_power * hover_power_factor
+    climb_power = (mass * GRAVITY * np.maximum(climb_rate, 0.0)) / motor_efficiency
+    
+    # Windeinfluss auf Forward-Thrust
+    effective_speed = np.hypot(speed + wind_x, wind_y)
+    safe_speed = np.where(speed > 0, speed, 1.0)
+    wind_factor = np.where(speed > 0, effective_speed / safe_speed, 1.0)
+    wind_power = forward_thrust_power * (wind_factor - 1.0) * 0.5
+    
+    total_power = lift_power + forward_thrust_power + climb_power + wind_power
+    return np.minimum(total_power, max_power)
+
+@njit(cache=True)
+def _plane_power_kernel(speed, climb_rate, air_density, wind_x,
+                        mass, max_power, drag_coefficient, wing_area,
+                        motor_efficiency, propeller_efficiency):
+    """Starrflügler-Leistung je Segment (wie calculate_plane_power)
+    
+    Ohne Wind ist wind_x Null, der Windanteil fällt dann ohne Verzweigung weg.
+    """
+    # Induced drag (Auftriebsinduzierter Widerstand)
+    lift_force = mass * GRAVITY
+    induced_drag_coeff = (lift_force / (0.5 * air_density * speed ** 2 * wing_area)) ** 2 / (math.pi * 8)
+    total_drag_coeff = drag_coefficient + induced_drag_coeff
+    drag_force = 0.5 * air_density * total_drag_coeff * wing_area * speed ** 2
+    horizontal_power = (drag_force * speed) / (motor_efficiency * propeller_efficiency)
+    
+    climb_power = (mass * GRAVITY * np.maximum(climb_rate, 0.0)) / motor_efficiency
+    
+    # Windeinfluss (vereinfacht: Windvektor in X-Richtung als Gegenwind)
+    safe_speed = np.where(speed > 0, speed, 1.0)
+    wind_factor = np.where(speed > 0, 1.0 + (wind_x / safe_speed) * 0.3, 1.0)
+    wind_power = horizontal_power * (wind_factor - 1.0)
+    
+    total_power = horizontal_power + climb_power + wind_power
+    return np.minimum(np.maximum(total_power, horizontal_power * 0.5), max_power)
+
+@njit(cache=True)
+def _multirotor_segment_kernel(horizontal_distance, vertical_distance, alt, has_wind, headwind, wind_x, wind_y,
+                               cruise_speed, max_speed, max_climb_rate, max_descent_speed,
+                               mass, max_power, hover_power, drag_coefficient, wing_area,
+                               rotor_diameter, motor_efficiency, propeller_efficiency,
+                               hover_motors_count):
+    """Alle Multirotor-Segmente einer Mission in einem Durchlauf berechnen
+    
+    Entspricht calculate_copter_interpolated_segments + calculate_multirotor_power
+    pro Segment, aber auf Arrays (Geometrie und Wind pro Segment).
+    Die Konfigurationswerte müssen bereits mit Defaults/Untergrenzen versehen sein.
+    
+    Returns:
+        (distance_m, duration_s, energy_wh) je Segment
+    """
+    total_3d_distance = np.hypot(horizontal_distance, vertical_distance)
+    
+    # Die langsamste Achse bestimmt die Flugzeit
+    max_horizontal_speed = min(cruise_speed, max_speed)
+    max_vertical_speed = np.where(vertical_distance > 0, max_climb_rate, max_descent_speed)
+    abs_vertical = np.abs(vertical_distance)
+    if max_horizontal_speed > 0:
+        time_horizontal = np.where(horizontal_distance > 0, horizontal_distance / max_horizontal_speed, 0.0)
+    else:
+        time_horizontal = np.zeros_like(horizontal_distance)
+    safe_vertical_speed = np.where(max_vertical_speed > 0, max_vertical_speed, 1.0)
+    time_vertical = np.where((abs_vertical > 0) & (max_vertical_speed > 0),
+                             abs_vertical / safe_vertical_speed, 0.0)
+    flight_time = np.maximum(time_horizontal, time_vertical)
+    moving = flight_time > 0
+    safe_time = np.where(moving, flight_time, 1.0)
+    
+    horizontal_speed = horizontal_distance / safe_time
+    climb_rate = vertical_distance / safe_time
+    air_density = _air_density_kernel((alt[:-1] + alt[1:]) / 2)
+    
+    # Airspeed aus Gegenwind entlang der Flugrichtung
+    speed = np.where(has_wind, np.maximum(horizontal_speed - headwind, 0.1), horizontal_speed)
+    base_hover_power = _hover_power_kernel(air_density, mass, hover_power, rotor_diameter, hover_motors_count)
+    power = _multirotor_power_kernel(speed, climb_rate, air_density, has_wind, wind_x, wind_y, base_hover_power,
+                                     mass, max_power, drag_coefficient, wing_area,
+                                     motor_efficiency, propeller_efficiency)
+    
+    energy = np.where(moving, power * flight_time / 3600, 0.0)
+    distance = np.where(moving, total_3d_distance, 0.0)
+    return distance, flight_time, energy
+
+class MultirotorParams(NamedTuple):
+    """Bereinigte Konfigurationswerte für die Multirotor-Kernels (Reihenfolge = Kernel-Argumente)"""
+    mass: float
+    max_power: float
+    hover_power: float  # 0.0 = per Momentum Theory schätzen
+    drag_coefficient: float
+    wing_area: float
+    rotor_diameter: float
+    motor_efficiency: float
+    propeller_efficiency: float
+    hover_motors_count: int
+
+class MissionArrays(NamedTuple):
+    """Ergebnis-Arrays je Segment einer Mission (Structure of Arrays)"""
+    distance: np.ndarray
+    flight_time: np.ndarray
+    energy: np.ndarray
+    average_speed: np.ndarray
+    average_power: np.ndarray
+    has_wind: np.ndarray
+    wind_speed: np.ndarray
+    wind_direction: np.ndarray
+    headwind: np.ndarray
+    crosswind: np.ndarray
+    flight_bearing_deg: np.ndarray
+
+@lru_cache(maxsize=None)
+def _hover_motors_count(frame_type: FrameType, motor_config: MotorConfiguration) -> int:
+    """Anzahl der Hover-Motoren je (Frame-Type, Motor-Konfiguration), einmal berechnet"""
+    base_count = BASE_MOTORS_PER_FRAME.get(frame_type, 4)  # Default: Quad
+    
+    # Coaxial-Konfiguration verdoppelt die Motoranzahl
+    if motor_config == MotorConfiguration.COAXIAL:
+        return base_count * 2
+    
+    return base_count
+
 class EnergyCalculator:
     def __init__(self):
         self.AIR_DENSITY = 1.225  # kg/m³ auf Meereshöhe
@@ -31,22 +312,8 @@ class EnergyCalculator:
         
     def calculate_distance(self, wp1: Waypoint, wp2: Waypoint) -> float:
         """Berechnet die 3D-Distanz zwischen zwei Waypoints in Metern"""
-        # Haversine Formel für horizontale Distanz
-        lat1, lon1, alt1 = math.radians(wp1.latitude), math.radians(wp1.longitude), wp1.altitude
-        lat2, lon2, alt2 = math.radians(wp2.latitude), math.radians(wp2.longitude), wp2.altitude
-        
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(max(0, a)))  # Sicherstellung, dass a nicht negativ ist
-        horizontal_distance = 6371000 * c  # Erdradius in Metern
-        
-        # 3D-Distanz mit Höhenunterschied
-        vertical_distance = alt2 - alt1
-        distance_3d = math.sqrt(horizontal_distance**2 + vertical_distance**2)
-        
-        return distance_3d
+        return _haversine_3d_kernel(wp1.latitude, wp1.longitude, wp1.altitude,
+                                    wp2.latitude, wp2.longitude, wp2.altitude)
     
     def calculate_air_density(self, altitude: float) -> float:
         """Berechnet die Luftdichte in Abhängigkeit der Höhe"""
@@ -69,20 +336,7 @@ class EnergyCalculator:
 
     def _calculate_hover_motors_count(self, config: VehicleConfig) -> int:
         """Berechnet die Anzahl der Hover-Motoren basierend auf Frame-Type und Motor-Konfiguration"""
-        frame_motor_count = {
-            FrameType.TRI: 3,
-            FrameType.QUAD: 4, 
-            FrameType.HEXA: 6,
-            FrameType.OCTO: 8
-        }
-        
-        base_count = frame_motor_count.get(config.frame_type, 4)  # Default: Quad
-        
-        # Coaxial-Konfiguration verdoppelt die Motoranzahl
-        if config.motor_config == MotorConfiguration.COAXIAL:
-            return base_count * 2
-        
-        return base_count
+        return _hover_motors_count(config.frame_type, config.motor_config)
 
     def calculate_multirotor_power(self, config: VehicleConfig, speed: float, 
                                    climb_rate: float, air_density: float, wind_data: WindData = None, airspeed: float = None) -> float:
@@ -147,8 +401,8 @@ class EnergyCalculator:
             
             return min(total_power, max_power)
             
-        except Exception as e:
-            print(f"ERROR in calculate_multirotor_power: {e}")
+        except Exception:
+            logger.exception("Error in calculate_multirotor_power")
             # Fallback: Basis-Leistungsschätzung
             return float(config.mass) * 20.0  # ~20W pro kg als Fallback
     
@@ -175,7 +429,7 @@ class EnergyCalculator:
             # Windeinfluss auf Forward-Thrust
             wind_power = 0
             if wind_data:
-                effective_speed = math.sqrt((speed + wind_data.wind_vector_x)**2 + wind_data.wind_vector_y**2)
+                effective_speed = math.hypot(speed + wind_data.wind_vector_x, wind_data.wind_vector_y)
                 wind_factor = effective_speed / speed if speed > 0 else 1.0
                 wind_power = forward_thrust_power * (wind_factor - 1.0) * 0.5
             
@@ -260,8 +514,8 @@ class EnergyCalculator:
             result = float(abs(total_hover_power))
             return result
             
-        except Exception as e:
-            print(f"ERROR in estimate_hover_power: {e}")
+        except Exception:
+            logger.exception("Error in estimate_hover_power")
             # Fallback-Berechnung: ~15W pro kg
             return float(config.mass) * 15.0
     
@@ -307,8 +561,8 @@ class EnergyCalculator:
                 penalty = min(0.4, excess_speed * 0.03)  # Max 40% Penalty
                 return 0.75 + penalty
                 
-        except Exception as e:
-            print(f"ERROR in _calculate_speed_efficiency_factor: {e}")
+        except Exception:
+            logger.exception("Error in _calculate_speed_efficiency_factor")
             return 1.0  # Fallback zu konservativer Schätzung
     
     def _calculate_dynamic_drag_coefficient(self, speed: float, config: VehicleConfig) -> float:
@@ -330,8 +584,8 @@ class EnergyCalculator:
                 speed_factor = (speed - 8.0) * 0.15  # 15% pro m/s über 8 m/s
                 return base_cd * (1.0 + speed_factor)
                 
-        except Exception as e:
-            print(f"ERROR in _calculate_dynamic_drag_coefficient: {e}")
+        except Exception:
+            logger.exception("Error in _calculate_dynamic_drag_coefficient")
             return float(config.drag_coefficient or 0.03)
     
     def _calculate_wind_power_impact(self, speed: float, wind_data: WindData, 
@@ -348,14 +602,14 @@ class EnergyCalculator:
             wind_y = float(wind_data.wind_vector_y) if wind_data.wind_vector_y is not None else 0
             
             # Gesamter Windvektor
-            wind_speed = math.sqrt(wind_x**2 + wind_y**2)
+            wind_speed = math.hypot(wind_x, wind_y)
             
             if wind_speed < 0.1 or speed < 0.1:
                 return 0.0
                 
             # Relative Geschwindigkeit zum Wind
             # Vereinfacht: Nehmen wir an, der Copter fliegt in x-Richtung
-            relative_speed = math.sqrt((speed + wind_x)**2 + wind_y**2)
+            relative_speed = math.hypot(speed + wind_x, wind_y)
             
             # Zusätzlicher Drag durch Wind
             base_drag = 0.5 * air_density * drag_coefficient * wing_area * speed**2
@@ -371,110 +625,42 @@ class EnergyCalculator:
             max_wind_power = base_drag * speed / (motor_efficiency * propeller_efficiency) * 0.5
             return min(wind_power, max_wind_power)
             
-        except Exception as e:
-            print(f"ERROR in _calculate_wind_power_impact: {e}")
+        except Exception:
+            logger.exception("Error in _calculate_wind_power_impact")
             return 0.0
     
     def calculate_energy_consumption(self, config: VehicleConfig, waypoints: List[Waypoint], 
-                                   wind_data: List[WindData] = None) -> SimulationResult:
-        """Hauptmethode zur Berechnung des Energieverbrauchs für eine komplette Mission"""
-        if len(waypoints) < 2:
-            raise ValueError("Mindestens 2 Waypoints erforderlich")
+                                   wind_data: List[WindData] = None,
+                                   include_segments: bool = True) -> SimulationResult:
+        """Hauptmethode zur Berechnung des Energieverbrauchs für eine komplette Mission
+        
+        Mit include_segments=False werden nur Summen und Summary berechnet,
+        flight_segments bleibt leer (spart den Aufbau der Segment-Objekte).
+        """
+        arrays = self._mission_arrays(config, waypoints, wind_data)
+        distance, flight_time, energy = arrays.distance, arrays.flight_time, arrays.energy
         
+        # Segmente erst am Ende aus den fertigen Arrays erstellen
         segments = []
-        total_energy = 0.0
-        total_time = 0.0
-        total_distance = 0.0
-        
-        for i in range(len(waypoints) - 1):
-            wp1 = waypoints[i]
-            wp2 = waypoints[i + 1]
-            
-            # Wind-Daten für dieses Segment
-            current_wind = wind_data[min(i, len(wind_data) - 1)] if wind_data else None
-            
-            # Unterschiedliche Berechnung je nach Fahrzeugtyp
-            if config.vehicle_type == VehicleType.MULTIROTOR:
-                # Neue copter-spezifische Interpolation
-                interpolation_result = self.calculate_copter_interpolated_segments(
-                    config, wp1, wp2, current_wind
-                )
-                
-                # Hauptsegment mit Gesamtwerten erstellen
-                segment = FlightSegment(
-                    segment_id=i,
-                    start_waypoint=waypoints[i],
-                    end_waypoint=waypoints[i + 1],
-                    distance_m=interpolation_result['total_distance'],
-                    duration_s=interpolation_result['total_time'],
-                    energy_wh=interpolation_result['total_energy'],
-                    average_speed_ms=interpolation_result['total_distance'] / interpolation_result['total_time'] if interpolation_result['total_time'] > 0 else 0,
-                    average_power_w=interpolation_result['total_energy'] * 3600 / interpolation_result['total_time'] if interpolation_result['total_time'] > 0 else 0,
-                    wind_influence=self._calculate_wind_components_relative_to_flight(wp1, wp2, current_wind) if current_wind else {
-                        "speed_ms": 0,
-                        "direction_deg": 0,
-                        "headwind_ms": 0,
-                        "crosswind_ms": 0,
-                        "influence_factor": 1.0
-                    }
-                )
-                
-                total_energy += interpolation_result['total_energy']
-                total_time += interpolation_result['total_time'] 
-                total_distance += interpolation_result['total_distance']
-                segments.append(segment)
-                
-            else:
-                # Traditionelle Berechnung für VTOL und Plane
-                distance = self.calculate_distance(wp1, wp2)
-                avg_altitude = (wp1.altitude + wp2.altitude) / 2
-                air_density = self.calculate_air_density(avg_altitude)
-                
-                # Geschwindigkeit und Steigrate
-                speed = config.cruise_speed if distance > 100 else config.cruise_speed * 0.7
-                climb_rate = (wp2.altitude - wp1.altitude) / (distance / speed) if distance > 0 else 0
-                
-                # Leistungsberechnung je nach Fahrzeugtyp
-                if config.vehicle_type == VehicleType.VTOL:
-                    power = self.calculate_vtol_power(config, speed, climb_rate, air_density, current_wind)
-                elif config.vehicle_type == VehicleType.PLANE:
-                    power = self.calculate_plane_power(config, speed, climb_rate, air_density, current_wind)
-                else:
-                    raise ValueError(f"Unbekannter Fahrzeugtyp: {config.vehicle_type}")
-                
-                # Zeit und Energieberechnung
-                flight_time = distance / speed if speed > 0 else 0
-                energy = (power * flight_time) / 3600  # Wh
-                
-                # Segment erstellen
-                segment = FlightSegment(
-                    segment_id=i,
-                    start_waypoint=waypoints[i],
-                    end_waypoint=waypoints[i + 1],
-                    distance_m=distance,
-                    duration_s=flight_time,
-                    energy_wh=energy,
-                    average_speed_ms=speed,
-                    average_power_w=power,
-                    wind_influence=self._calculate_wind_components_relative_to_flight(wp1, wp2, current_wind) if current_wind else {
-                        "speed_ms": 0,
-                        "direction_deg": 0,
-                        "headwind_ms": 0,
-                        "crosswind_ms": 0,
-                        "influence_factor": 1.0
-                    }
-                )
-                
-                total_energy += energy
-                total_time += flight_time
-                total_distance += distance
-                segments.append(segment)
+        if include_segments:
+            wind_influence = self._build_wind_influence(
+                arrays.has_wind, arrays.wind_speed, arrays.wind_direction,
+                arrays.headwind, arrays.crosswind, arrays.flight_bearing_deg
+            )
+            segments = self._build_segments(waypoints, distance, flight_time, energy,
+                                            arrays.average_speed, arrays.average_power, wind_influence)
+        
+        # Summen direkt über die Arrays
+        total_energy = float(energy.sum())
+        total_time = float(flight_time.sum())
+        total_distance = float(distance.sum())
         
         # Batteriekapazität prüfen
         battery_capacity_wh = (config.battery_capacity * config.battery_voltage) / 1000  # mAh * V / 1000 = Wh
         battery_usage_percent = (total_energy / battery_capacity_wh) * 100
         
-        return SimulationResult(
+        # Ergebnisse stammen aus der eigenen Berechnung - Validierung überspringen
+        return SimulationResult.model_construct(
             total_energy_wh=total_energy,
             total_distance_m=total_distance,
             total_time_s=total_time,
@@ -492,6 +678,245 @@ class EnergyCalculator:
             }
         )
     
+    def segments_df(self, config: VehicleConfig, waypoints: List[Waypoint],
+                    wind_data: List[WindData] = None):
+        """Segment-Ergebnisse als pandas DataFrame, direkt aus den Arrays gebaut
+        
+        Gleiche Werte wie flight_segments von calculate_energy_consumption, aber ohne
+        einzelne FlightSegment-Objekte - eine Zeile je Segment.
+        """
+        import pandas as pd
+        
+        arrays = self._mission_arrays(config, waypoints, wind_data)
+        lat = np.array([wp.latitude for wp in waypoints], dtype=np.float64)
+        lon = np.array([wp.longitude for wp in waypoints], dtype=np.float64)
+        alt = np.array([wp.altitude for wp in waypoints], dtype=np.float64)
+        return pd.DataFrame({
+            "segment_id": np.arange(len(waypoints) - 1),
+            "start_latitude": lat[:-1],
+            "start_longitude": lon[:-1],
+            "start_altitude": alt[:-1],
+            "end_latitude": lat[1:],
+            "end_longitude": lon[1:],
+            "end_altitude": alt[1:],
+            "distance_m": arrays.distance,
+            "duration_s": arrays.flight_time,
+            "energy_wh": arrays.energy,
+            "average_speed_ms": arrays.average_speed,
+            "average_power_w": arrays.average_power,
+            "wind_speed_ms": arrays.wind_speed,
+            "headwind_ms": arrays.headwind,
+            "crosswind_ms": arrays.crosswind,
+            "flight_bearing_deg": arrays.flight_bearing_deg,
+        })
+    
+    def _mission_arrays(self, config: VehicleConfig, waypoints: List[Waypoint],
+                        wind_data: List[WindData] = None) -> MissionArrays:
+        """Distanz, Zeit, Energie, Leistung und Wind aller Segmente als Arrays berechnen"""
+        if len(waypoints) < 2:
+            raise ValueError("Mindestens 2 Waypoints erforderlich")
+        
+        # Geometrie und Windkomponenten aller Segmente in einem Durchlauf
+        segment_count = len(waypoints) - 1
+        lat = np.array([wp.latitude for wp in waypoints], dtype=np.float64)
+        lon = np.array([wp.longitude for wp in waypoints], dtype=np.float64)
+        alt = np.array([wp.altitude for wp in waypoints], dtype=np.float64)
+        has_wind, wind_x, wind_y, wind_speed, wind_direction = self._segment_wind_arrays(wind_data, segment_count)
+        
+        horizontal_distance, vertical_distance, flight_bearing_deg = _route_geometry_kernel(lat, lon, alt)
+        headwind, crosswind = _wind_components_kernel(flight_bearing_deg, wind_x, wind_y)
+        
+        if config.vehicle_type == VehicleType.MULTIROTOR:
+            # Copter-Interpolation für alle Segmente auf einmal
+            distance, flight_time, energy = self._calculate_multirotor_segments(
+                config, horizontal_distance, vertical_distance, alt, has_wind, headwind, wind_x, wind_y
+            )
+            average_speed = np.divide(distance, flight_time, out=np.zeros_like(distance), where=flight_time > 0)
+            average_power = np.divide(energy * 3600, flight_time, out=np.zeros_like(energy), where=flight_time > 0)
+        elif config.vehicle_type in (VehicleType.VTOL, VehicleType.PLANE):
+            # Traditionelle Berechnung für VTOL und Plane
+            distance = np.hypot(horizontal_distance, vertical_distance)
+            air_density = _air_density_kernel((alt[:-1] + alt[1:]) / 2)
+            
+            # Geschwindigkeit und Steigrate
+            cruise_speed = float(config.cruise_speed)
+            if cruise_speed <= 0:
+                # Kernels teilen durch speed bzw. speed**2
+                raise ValueError(f"Reisegeschwindigkeit muss größer 0 sein: {config.cruise_speed}")
+            speed = np.where(distance > 100, cruise_speed, cruise_speed * 0.7)
+            climb_rate = np.divide(vertical_distance, distance / speed,
+                                   out=np.zeros_like(distance), where=distance > 0)
+            
+            # Leistungsberechnung je nach Fahrzeugtyp (alle Segmente in einem Aufruf)
+            if config.vehicle_type == VehicleType.VTOL:
+                average_power = self._calculate_vtol_powers(
+                    config, speed, climb_rate, air_density, has_wind, wind_x, wind_y)
+            else:
+                average_power = _plane_power_kernel(
+                    speed, climb_rate, air_density, wind_x,
+                    float(config.mass),
+                    float(config.max_power),
+                    float(config.drag_coefficient),
+                    float(config.wing_area),
+                    float(config.motor_efficiency),
+                    float(config.propeller_efficiency)
+                )
+            
+            # Zeit und Energieberechnung
+            flight_time = np.divide(distance, speed, out=np.zeros_like(distance), where=speed > 0)
+            energy = (average_power * flight_time) / 3600  # Wh
+            average_speed = speed
+        else:
+            raise ValueError(f"Unbekannter Fahrzeugtyp: {config.vehicle_type}")
+        
+        return MissionArrays(distance, flight_time, energy, average_speed, average_power,
+                             has_wind, wind_speed, wind_direction, headwind, crosswind, flight_bearing_deg)
+        
+    
+    def _build_segments(self, waypoints: List[Waypoint], distance: np.ndarray, flight_time: np.ndarray,
+                        energy: np.ndarray, average_speed: np.ndarray, average_power: np.ndarray,
+                        wind_influence: List[Dict[str, float]]) -> List[FlightSegment]:
+        """FlightSegment-Objekte aus den Segment-Arrays bauen (interne Daten, ohne Validierung)"""
+        segments = []
+        for i, (segment_distance, segment_time, segment_energy, segment_speed, segment_power) in enumerate(zip(
+                distance.tolist(), flight_time.tolist(), energy.tolist(),
+                average_speed.tolist(), average_power.tolist())):
+            segments.append(FlightSegment.model_construct(
+                segment_id=i,
+                start_waypoint=waypoints[i],
+                end_waypoint=waypoints[i + 1],
+                distance_m=segment_distance,
+                duration_s=segment_time,
+                energy_wh=segment_energy,
+                average_speed_ms=segment_speed,
+                average_power_w=segment_power,
+                wind_influence=wind_influence[i]
+            ))
+        return segments
+    
+    def _segment_wind_arrays(self, wind_data: List[WindData], segment_count: int):
+        """Wind-Daten als Arrays je Segment (Structure of Arrays)
+        
+        Segment i nutzt wind_data[i]; sind weniger Wind-Daten als Segmente vorhanden,
+        gilt der letzte Wert für alle weiteren Segmente.
+        
+        Returns:
+            (has_wind, wind_x, wind_y, wind_speed_ms, wind_direction_deg) je Segment
+        """
+        if not wind_data:
+            zeros = np.zeros(segment_count, dtype=np.float64)
+            return np.zeros(segment_count, dtype=np.bool_), zeros, zeros, zeros, zeros
+        
+        samples = wind_data[:segment_count]
+        # Index des Windwerts je Segment: min(i, len - 1)
+        sample_index = np.minimum(np.arange(segment_count), len(samples) - 1)
+        
+        def per_segment(values):
+            return np.array(values, dtype=np.float64)[sample_index]
+        
+        return (
+            np.ones(segment_count, dtype=np.bool_),
+            per_segment([wind.wind_vector_x for wind in samples]),
+            per_segment([wind.wind_vector_y for wind in samples]),
+            per_segment([wind.wind_speed_ms for wind in samples]),
+            per_segment([wind.wind_direction_deg for wind in samples])
+        )
+    
+    def _build_wind_influence(self, has_wind: np.ndarray, wind_speed: np.ndarray, wind_direction: np.ndarray,
+                              headwind: np.ndarray, crosswind: np.ndarray,
+                              flight_bearing_deg: np.ndarray) -> List[Dict[str, float]]:
+        """wind_influence-Dicts aller Segmente aus den vektorisierten Windkomponenten bauen
+        
+        Segmente ohne Wind teilen sich ein Dict (wird nur gelesen und serialisiert).
+        """
+        no_wind = {
+            "speed_ms": 0,
+            "direction_deg": 0,
+            "headwind_ms": 0,
+            "crosswind_ms": 0,
+            "influence_factor": 1.0
+        }
+        if not has_wind.any():
+            return [no_wind] * len(has_wind)
+        
+        return [
+            {
+                "speed_ms": speed_ms,
+                "direction_deg": direction_deg,
+                "headwind_ms": round(headwind_ms, 2),
+                "crosswind_ms": round(crosswind_ms, 2),
+                "influence_factor": 1.0,
+                "flight_bearing_deg": round(bearing_deg, 1)  # Debug info
+            } if wind else no_wind
+            for wind, speed_ms, direction_deg, headwind_ms, crosswind_ms, bearing_deg in zip(
+                has_wind.tolist(), wind_speed.tolist(), wind_direction.tolist(),
+                headwind.tolist(), crosswind.tolist(), flight_bearing_deg.tolist())
+        ]
+    
+    def _calculate_multirotor_segments(self, config: VehicleConfig, horizontal_distance: np.ndarray,
+                                       vertical_distance: np.ndarray, alt: np.ndarray, has_wind: np.ndarray,
+                                       headwind: np.ndarray, wind_x: np.ndarray, wind_y: np.ndarray):
+        """Distanz, Dauer und Energie aller Multirotor-Segmente über den Array-Kernel berechnen
+        
+        Liefert dieselben Werte wie calculate_copter_interpolated_segments pro Segment.
+        """
+        distance, duration, energy = _multirotor_segment_kernel(
+            horizontal_distance, vertical_distance, alt, has_wind, headwind, wind_x, wind_y,
+            float(config.cruise_speed),
+            float(config.max_speed),
+            float(config.max_climb_rate),
+            float(config.max_descent_speed),
+            *self._multirotor_power_params(config)
+        )
+        return distance, duration, energy
+    
+    def _multirotor_power_params(self, config: VehicleConfig) -> MultirotorParams:
+        """Konfigurationswerte für die Multirotor-Kernels, einmal pro Mission aufbereitet
+        
+        Defaults und Untergrenzen wie in calculate_multirotor_power; die Kernels
+        selbst brauchen dann keine Guards mehr.
+        """
+        return MultirotorParams(
+            float(config.mass),
+            float(config.max_power),
+            float(config.hover_power or 0.0),
+            float(config.drag_coefficient or 0.03),
+            max(0.01, float(config.wing_area or 0.5)),
+            max(0.1, float(config.rotor_diameter or 0.3)),
+            max(0.1, float(config.motor_efficiency or 0.85)),
+            max(0.1, float(config.propeller_efficiency or 0.75)),
+            self._calculate_hover_motors_count(config)
+        )
+    
+    def _calculate_vtol_powers(self, config: VehicleConfig, speed: np.ndarray, climb_rate: np.ndarray,
+                               air_density: np.ndarray, has_wind: np.ndarray, wind_x: np.ndarray,
+                               wind_y: np.ndarray) -> np.ndarray:
+        """Leistung aller VTOL-Segmente über die Array-Kernels berechnen
+        
+        Liefert dieselben Werte wie calculate_vtol_power pro Segment: unter 5 m/s
+        Multirotor-Leistung, sonst Hover-Motoren + Forward-Thrust.
+        """
+        params = self._multirotor_power_params(config)
+        
+        # Schwebeleistung hängt nur von der Luftdichte ab - einmal für beide Modi
+        base_hover_power = _hover_power_kernel(air_density, params.mass, params.hover_power,
+                                               params.rotor_diameter, params.hover_motors_count)
+        
+        hover_mode_power = _multirotor_power_kernel(
+            speed, climb_rate, air_density, has_wind, wind_x, wind_y, base_hover_power,
+            params.mass, params.max_power, params.drag_coefficient, params.wing_area,
+            params.motor_efficiency, params.propeller_efficiency
+        )
+        cruise_mode_power = _vtol_cruise_power_kernel(
+            speed, climb_rate, wind_x, wind_y, base_hover_power,
+            params.mass,
+            params.max_power,
+            float(config.max_speed),
+            float(config.forward_thrust_power or (config.max_power * 0.3)),
+            float(config.motor_efficiency)
+        )
+        return np.where(speed < 5.0, hover_mode_power, cruise_mode_power)
+    
     def calculate_copter_interpolated_segments(self, config: VehicleConfig, start_wp: Waypoint, 
                                              end_wp: Waypoint, wind_data: WindData = None) -> Dict:
         """
@@ -499,7 +924,9 @@ class EnergyCalculator:
         Geschwindigkeit wird durch langsamste Achse (horizontal/vertikal) begrenzt
         """
         try:
-            print(f"DEBUG: Starting copter interpolation from ({start_wp.latitude}, {start_wp.longitude}, {start_wp.altitude}) to ({end_wp.latitude}, {end_wp.longitude}, {end_wp.altitude})")
+            logger.debug("Starting copter interpolation from (%s, %s, %s) to (%s, %s, %s)",
+                         start_wp.latitude, start_wp.longitude, start_wp.altitude,
+                         end_wp.latitude, end_wp.longitude, end_wp.altitude)
             
             # Horizontale Distanz berechnen
             lat1, lon1 = math.radians(float(start_wp.latitude)), math.radians(float(start_wp.longitude))
@@ -513,13 +940,13 @@ class EnergyCalculator:
             c = 2 * math.asin(math.sqrt(a))
             horizontal_distance = 6371000 * c  # Erdradius in Metern
             
-            print(f"DEBUG: Horizontal distance: {horizontal_distance}")
+            logger.debug("Horizontal distance: %s", horizontal_distance)
             
             # Vertikale Distanz
             vertical_distance = float(end_wp.altitude) - float(start_wp.altitude)
-            total_3d_distance = math.sqrt(horizontal_distance**2 + vertical_distance**2)
+            total_3d_distance = math.hypot(horizontal_distance, vertical_distance)
             
-            print(f"DEBUG: Vertical distance: {vertical_distance}, Total 3D distance: {total_3d_distance}")
+            logger.debug("Vertical distance: %s, Total 3D distance: %s", vertical_distance, total_3d_distance)
             
             # Maximalgeschwindigkeiten ermitteln - alle zu float konvertieren
             max_horizontal_speed = min(float(config.cruise_speed), float(config.max_speed))
@@ -530,18 +957,18 @@ class EnergyCalculator:
             else:
                 max_vertical_speed = float(config.max_descent_speed)  # Sinken
             
-            print(f"DEBUG: Max horizontal speed: {max_horizontal_speed}, Max vertical speed: {max_vertical_speed}")
+            logger.debug("Max horizontal speed: %s, Max vertical speed: %s", max_horizontal_speed, max_vertical_speed)
             
             # Zeit berechnen, die für jede Achse benötigt wird
             time_horizontal = horizontal_distance / max_horizontal_speed if horizontal_distance > 0 and max_horizontal_speed > 0 else 0
             time_vertical = abs(vertical_distance) / max_vertical_speed if abs(vertical_distance) > 0 and max_vertical_speed > 0 else 0
             
-            print(f"DEBUG: Time horizontal: {time_horizontal}, Time vertical: {time_vertical}")
+            logger.debug("Time horizontal: %s, Time vertical: %s", time_horizontal, time_vertical)
             
             # Die langsamste Achse bestimmt die Gesamtzeit
             flight_time = max(float(time_horizontal), float(time_vertical))
             
-            print(f"DEBUG: Flight time: {flight_time}")
+            logger.debug("Flight time: %s", flight_time)
             
             # Wenn keine Bewegung nötig ist
             if flight_time == 0:
@@ -559,20 +986,21 @@ class EnergyCalculator:
             # Steigrate berechnen (positiv für Steigen, negativ für Sinken)
             climb_rate = vertical_distance / flight_time if flight_time > 0 else 0
             
-            print(f"DEBUG: Actual horizontal speed: {actual_horizontal_speed}, Climb rate: {climb_rate}")
+            logger.debug("Actual horizontal speed: %s, Climb rate: %s", actual_horizontal_speed, climb_rate)
             
             # Durchschnittliche Höhe für Luftdichte
             avg_altitude = (float(start_wp.altitude) + float(end_wp.altitude)) / 2
             air_density = self.calculate_air_density(avg_altitude)
             
-            print(f"DEBUG: Average altitude: {avg_altitude}, Air density: {air_density}")
+            logger.debug("Average altitude: %s, Air density: %s", avg_altitude, air_density)
             
             # Leistungsberechnung für den gesamten Flug mit korrigierter Airspeed
-            print(f"DEBUG: About to call calculate_multirotor_power with speed={actual_horizontal_speed}, climb_rate={climb_rate}, air_density={air_density}, wind_data={wind_data}")
+            logger.debug("About to call calculate_multirotor_power with speed=%s, climb_rate=%s, air_density=%s, wind_data=%s",
+                         actual_horizontal_speed, climb_rate, air_density, wind_data)
             
             # Für realistische Airspeed-Berechnung brauchen wir die Flugrichtung
             if wind_data:
-                # Flugrichtung berechnen (gleich wie in _calculate_wind_components_relative_to_flight)
+                # Flugrichtung berechnen (gleich wie in _route_geometry_kernel)
                 lat1, lon1 = math.radians(float(start_wp.latitude)), math.radians(float(start_wp.longitude))
                 lat2, lon2 = math.radians(float(end_wp.latitude)), math.radians(float(end_wp.longitude))
                 dlon = lon2 - lon1
@@ -595,7 +1023,8 @@ class EnergyCalculator:
                 
                 # Airspeed = Ground Speed - Headwind (bei Gegenwind wird Airspeed kleiner)
                 airspeed = max(0.1, actual_horizontal_speed - headwind_component)
-                print(f"DEBUG: Ground speed: {actual_horizontal_speed}, Headwind: {headwind_component}, Airspeed: {airspeed}")
+                logger.debug("Ground speed: %s, Headwind: %s, Airspeed: %s",
+                             actual_horizontal_speed, headwind_component, airspeed)
                 
                 # Windkorrigierte Daten für Power-Berechnung erstellen
                 wind_data_corrected = wind_data
@@ -604,15 +1033,15 @@ class EnergyCalculator:
                 wind_data_corrected = None
                 
             power = self.calculate_multirotor_power(config, airspeed, climb_rate, air_density, wind_data_corrected)
-            print(f"DEBUG: Power calculated: {power}, type: {type(power)}")
+            logger.debug("Power calculated: %s, type: %s", power, type(power))
             
             # Sicherheitscheck für power
             if isinstance(power, complex):
-                print(f"ERROR: Power is complex number: {power}")
+                logger.error("Power is complex number: %s", power)
                 power = float(abs(power))
                 
             energy = (float(power) * float(flight_time)) / 3600  # Wh
-            print(f"DEBUG: Energy calculated: {energy}")
+            logger.debug("Energy calculated: %s", energy)
             
             return {
                 'segments': [{
@@ -631,10 +1060,8 @@ class EnergyCalculator:
                 'total_distance': float(total_3d_distance)
             }
             
-        except Exception as e:
-            print(f"ERROR in calculate_copter_interpolated_segments: {e}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error in calculate_copter_interpolated_segments")
             # Fallback
             return {
                 'segments': [],
@@ -642,78 +1069,3 @@ class EnergyCalculator:
                 'total_energy': float(config.mass) * 20.0 / 60,  # Simple energy estimate
                 'total_distance': 100.0  # 100m fallback
             }
-    
-    def _calculate_wind_components_relative_to_flight(self, start_wp: Waypoint, end_wp: Waypoint, wind_data: WindData) -> Dict[str, float]:
-        """Berechnet Gegen- und Seitenwindkomponenten relativ zur Flugrichtung
-        
-        Args:
-            start_wp: Start-Waypoint
-            end_wp: Ziel-Waypoint  
-            wind_data: Windvektor-Daten
-            
-        Returns:
-            Dict mit wind_influence Komponenten
-        """
-        try:
-            print(f"DEBUG: _calculate_wind_components_relative_to_flight called")
-            print(f"DEBUG: Start WP: {start_wp.latitude}, {start_wp.longitude}")
-            print(f"DEBUG: End WP: {end_wp.latitude}, {end_wp.longitude}")
-            print(f"DEBUG: Wind data: speed={wind_data.wind_speed_ms}, dir={wind_data.wind_direction_deg}")
-            print(f"DEBUG: Wind vectors: x={wind_data.wind_vector_x}, y={wind_data.wind_vector_y}")
-            
-            # Flugrichtung berechnen (Bearing von start zu end)
-            lat1, lon1 = math.radians(start_wp.latitude), math.radians(start_wp.longitude)
-            lat2, lon2 = math.radians(end_wp.latitude), math.radians(end_wp.longitude)
-            
-            dlon = lon2 - lon1
-            
-            # Flugrichtung in Grad (0° = Norden, 90° = Osten)
-            flight_bearing_rad = math.atan2(
-                math.sin(dlon) * math.cos(lat2),
-                math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
-            )
-            
-            flight_bearing_deg = (math.degrees(flight_bearing_rad) + 360) % 360
-            print(f"DEBUG: Flight bearing: {flight_bearing_deg}°")
-            
-            # Windrichtung und -vektoren
-            wind_speed = wind_data.wind_speed_ms
-            wind_direction_deg = wind_data.wind_direction_deg
-            wind_vector_x = wind_data.wind_vector_x  # Ost-West
-            wind_vector_y = wind_data.wind_vector_y  # Nord-Süd
-            
-            # Windvektor relativ zur Flugrichtung projizieren
-            # Flugrichtung als Einheitsvektor
-            flight_direction_x = math.sin(math.radians(flight_bearing_deg))  # Ost-West Komponente der Flugrichtung
-            flight_direction_y = math.cos(math.radians(flight_bearing_deg))  # Nord-Süd Komponente der Flugrichtung
-            
-            print(f"DEBUG: Flight direction vector: x={flight_direction_x}, y={flight_direction_y}")
-            
-            # Gegenwind: Windvektor projiziert auf Flugrichtung (negativ = Gegenwind)
-            headwind_ms = -(wind_vector_x * flight_direction_x + wind_vector_y * flight_direction_y)
-            
-            # Seitenwind: Windvektor senkrecht zur Flugrichtung
-            # Senkrechte Richtung: (-flight_direction_y, flight_direction_x) 
-            crosswind_ms = wind_vector_x * (-flight_direction_y) + wind_vector_y * flight_direction_x
-            
-            print(f"DEBUG: Calculated headwind: {headwind_ms}, crosswind: {crosswind_ms}")
-            
-            return {
-                "speed_ms": wind_speed,
-                "direction_deg": wind_direction_deg,
-                "headwind_ms": round(headwind_ms, 2),
-                "crosswind_ms": round(crosswind_ms, 2),
-                "influence_factor": 1.0,
-                "flight_bearing_deg": round(flight_bearing_deg, 1)  # Debug info
-            }
-            
-        except Exception as e:
-            print(f"ERROR in _calculate_wind_components_relative_to_flight: {e}")
-            # Fallback zu alten Werten
-            return {
-                "speed_ms": wind_data.wind_speed_ms,
-                "direction_deg": wind_data.wind_direction_deg,
-                "headwind_ms": 0,
-                "crosswind_ms": 0,
-                "influence_factor": 1.0
-            }
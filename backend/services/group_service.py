@@ -10,10 +10,11 @@ the Free Software Foundation, either version 3 of the License, or
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
 from fastapi import HTTPException, status
 
-from models.user import User, UserGroup, GroupCreate, GroupResponse, GroupJoin
+from models.user import User, UserGroup, GroupCreate, GroupResponse, GroupJoin, user_group_association
 
 def create_group(db: Session, group_create: GroupCreate, owner: User) -> UserGroup:
     """Create a new group"""
@@ -88,12 +89,30 @@ def leave_group(db: Session, group_id: int, user: User) -> bool:
     return True
 
 def get_user_groups(db: Session, user: User) -> List[UserGroup]:
-    """Get all groups the user is a member of"""
-    return user.groups
+    """Get all groups the user is a member of
+    
+    Owner and members are loaded with one extra query each for all groups,
+    since format_group_response reads both for every group.
+    """
+    members = user_group_association.c
+    return (
+        db.query(UserGroup)
+        .join(user_group_association, members.group_id == UserGroup.id)
+        .filter(members.user_id == user.id)
+        .options(selectinload(UserGroup.owner), selectinload(UserGroup.members))
+        .order_by(UserGroup.id)
+        .all()
+    )
 
 def get_group_members(db: Session, group_id: int, user: User) -> List[User]:
     """Get all members of a group (only if user is a member)"""
-    group = db.query(UserGroup).filter(UserGroup.id == group_id).first()
+    # Group and members in one query - the membership check and the response need both
+    group = (
+        db.query(UserGroup)
+        .options(joinedload(UserGroup.members))
+        .filter(UserGroup.id == group_id)
+        .first()
+    )
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -112,21 +131,28 @@ def can_access_session(db: Session, session_id: int, user: User) -> bool:
     """Check if user can access a session (owner or group member with access)"""
     from models.database import SimulationSession
     
-    session = db.query(SimulationSession).filter(SimulationSession.id == session_id).first()
+    session = db.get(SimulationSession, session_id)
     if not session:
         return False
-    
+    return can_access_loaded_session(db, session, user)
+
+def can_access_loaded_session(db: Session, session, user: User) -> bool:
+    """Check access for an already loaded session (no reload of the session row)"""
     # Session owner can always access
     if session.owner_id == user.id:
         return True
+    if session.owner_id is None:
+        return False
     
-    # Check if user is in same group as session owner
-    if session.owner:
-        for group in session.owner.groups:
-            if user in group.members:
-                return True
-    
-    return False
+    # Check if user is in same group as session owner (one query instead of
+    # lazy-loading the owner, their groups and every group's member list)
+    members = user_group_association.c
+    owner_groups = select(members.group_id).where(members.user_id == session.owner_id)
+    shared = select(members.user_id).where(
+        members.user_id == user.id,
+        members.group_id.in_(owner_groups)
+    )
+    return db.execute(select(shared.exists())).scalar()
 
 def format_group_response(group: UserGroup) -> GroupResponse:
     """Format group for API response"""
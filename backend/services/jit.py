@@ -0,0 +1,23 @@
+"""
+Optionale Numba-Unterstützung für die numerischen Kernels
+
+Ist Numba installiert, werden die mit @njit markierten Funktionen beim ersten
+Aufruf kompiliert. Ohne Numba laufen dieselben Funktionen unverändert als
+NumPy-Code weiter. Mit NUMBA_DISABLE_JIT=1 lässt sich die Kompilierung auch
+bei installiertem Numba abschalten (z.B. zum Debuggen).
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba ist optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Ersatz für numba.njit: Funktion unverändert zurückgeben"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -1,5 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, load_only, selectinload
 from models.database import SimulationSession, FlightSegment
+from models.user import User, user_group_association
 from models.simulation import SimulationRequest, SimulationResult
 import json
 from datetime import datetime
@@ -89,11 +91,16 @@ class SessionService:
     
     def get_session(self, db: Session, session_id: int) -> Optional[SimulationSession]:
         """Lädt eine Session mit allen Daten"""
-        return db.query(SimulationSession).filter(SimulationSession.id == session_id).first()
+        return db.get(SimulationSession, session_id)
     
     def get_session_with_segments(self, db: Session, session_id: int) -> Optional[SimulationSession]:
-        """Lädt eine Session mit allen Flight Segments"""
-        return db.query(SimulationSession).filter(SimulationSession.id == session_id).first()
+        """Lädt eine Session mit allen Flight Segments (zwei Abfragen statt Lazy Load)"""
+        return (
+            db.query(SimulationSession)
+            .options(selectinload(SimulationSession.flight_segments))
+            .filter(SimulationSession.id == session_id)
+            .first()
+        )
     
     def restore_simulation_data(self, db: Session, session_id: int) -> Dict[str, Any]:
         """Stellt alle Daten einer Session wieder her für die Wiederverwendung"""
@@ -122,6 +129,39 @@ class SessionService:
         """Lädt alle Sessions (ohne detaillierte Daten)"""
         return db.query(SimulationSession).order_by(SimulationSession.created_at.desc()).limit(limit).all()
     
+    def get_accessible_sessions(self, db: Session, user: User, limit: int = 100) -> List[SimulationSession]:
+        """Lädt alle Sessions, auf die der User zugreifen darf, in einer Abfrage
+        
+        Zugriff haben der Besitzer und alle User, die mit dem Besitzer eine Gruppe teilen.
+        Es werden nur die Spalten für die Session-Liste geladen.
+        """
+        members = user_group_association.c
+        user_groups = select(members.group_id).where(members.user_id == user.id)
+        group_peers = select(members.user_id).where(members.group_id.in_(user_groups))
+        
+        return (
+            db.query(SimulationSession)
+            .options(load_only(
+                SimulationSession.id,
+                SimulationSession.name,
+                SimulationSession.description,
+                SimulationSession.vehicle_type,
+                SimulationSession.total_energy_wh,
+                SimulationSession.total_distance_m,
+                SimulationSession.total_time_s,
+                SimulationSession.battery_usage_percent,
+                SimulationSession.created_at,
+                SimulationSession.owner_id
+            ))
+            .filter(or_(
+                SimulationSession.owner_id == user.id,
+                SimulationSession.owner_id.in_(group_peers)
+            ))
+            .order_by(SimulationSession.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+    
     def update_session_name(self, db: Session, session_id: int, new_name: str) -> bool:
         """Aktualisiert den Namen einer Session"""
         session = db.query(SimulationSession).filter(SimulationSession.id == session_id).first()
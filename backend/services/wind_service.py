@@ -1,63 +1,282 @@
 import httpx
+import logging
 import math
-from typing import Dict, Any, Optional, List
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from models.waypoint import WindData
 from datetime import datetime, timezone, timedelta
 import os
 import asyncio
 
+logger = logging.getLogger(__name__)
+
+# Verbindungen zu Windfinder über alle Anfragen wiederverwenden
+HTTP_TIMEOUT_S = 10.0
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 50
+# Obergrenze gleichzeitiger Anfragen an die Wetter-API
+WIND_MAX_CONCURRENT_REQUESTS = 16
+
+# Winddaten ändern sich höchstens stündlich
+WIND_CACHE_TTL_S = 3600
+WIND_CACHE_MAX_ENTRIES = 4096
+
 class WindService:
     def __init__(self):
         self.api_key = os.getenv("WINDFINDER_API_KEY")
         self.base_url = "https://api.windfinder.com/v2"
         self.fallback_enabled = True
+        # LRU-Cache: (lat, lon, alt, Stunde) -> (Ablaufzeit, WindData)
+        self._wind_cache: "OrderedDict[Tuple[float, float, int, int], Tuple[float, WindData]]" = OrderedDict()
+        # Gemeinsamer HTTP-Client, wird über start()/close() im App-Lifespan verwaltet
+        self.client: Optional[httpx.AsyncClient] = None
+        self._request_limit = asyncio.Semaphore(WIND_MAX_CONCURRENT_REQUESTS)
+        # Laufende Abfragen je Cache-Schlüssel - parallele Simulationen teilen sich eine Abfrage
+        self._in_flight: Dict[Tuple[float, float, int, int], asyncio.Future] = {}
+        
+    async def start(self):
+        """Gemeinsamen HTTP-Client für Keep-Alive-Verbindungen anlegen"""
+        self._get_client()
+    
+    async def close(self):
+        """Gemeinsamen HTTP-Client schließen"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """HTTP-Client liefern, bei Nutzung außerhalb des Lifespans bei Bedarf anlegen"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT_S,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE
+                )
+            )
+        return self.client
+        
+    def _wind_cache_key(self, latitude: float, longitude: float, altitude: float,
+                        forecast_time: Optional[datetime]) -> Tuple[float, float, int, int]:
+        """Cache-Schlüssel: ~100 m Raster horizontal, 50 m Höhenstufen, volle Stunde"""
+        target_time = forecast_time if forecast_time else datetime.now(timezone.utc)
+        return (
+            round(latitude, 3),
+            round(longitude, 3),
+            round(altitude / 50) * 50,
+            int(target_time.timestamp() // 3600)
+        )
         
     async def get_wind_data(self, latitude: float, longitude: float, altitude: float, 
                           forecast_time: Optional[datetime] = None) -> WindData:
         """Winddaten von Windfinder API abrufen oder Fallback verwenden
         
+        Ergebnisse werden pro Rasterzelle und Stunde gecacht.
+        
         Args:
             latitude: Breitengrad
             longitude: Längengrad  
             altitude: Höhe in Metern
             forecast_time: Zeitpunkt für Vorhersage (UTC), None = aktuell
         """
+        batch = await self.get_wind_data_batch([(latitude, longitude, altitude)], forecast_time)
+        return batch[0]
+    
+    def _get_cached_wind(self, key: Tuple[float, float, int, int], latitude: float,
+                         longitude: float, altitude: float) -> Optional[WindData]:
+        """Gültigen Cache-Eintrag mit der Position des anfragenden Wegpunkts liefern"""
+        cached = self._wind_cache.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del self._wind_cache[key]
+            return None
+        self._wind_cache.move_to_end(key)
+        return cached[1].model_copy(update={
+            "latitude": latitude,
+            "longitude": longitude,
+            "altitude": altitude
+        })
+    
+    def _store_cached_wind(self, key: Tuple[float, float, int, int], wind_data: WindData):
+        """Winddaten im Cache ablegen, älteste Einträge bei voller Kapazität verdrängen"""
+        self._wind_cache[key] = (time.monotonic() + WIND_CACHE_TTL_S, wind_data)
+        self._wind_cache.move_to_end(key)
+        while len(self._wind_cache) > WIND_CACHE_MAX_ENTRIES:
+            self._wind_cache.popitem(last=False)
+    
+    async def get_wind_data_batch(self, points: List[Tuple[float, float, float]],
+                                  forecast_time: Optional[datetime] = None) -> List[WindData]:
+        """Winddaten für mehrere Punkte mit einem einzigen API-Aufruf abrufen
+        
+        Gecachte Punkte werden nicht erneut abgefragt, ebenso Punkte, deren Rasterzelle
+        gerade von einer parallelen Anfrage geladen wird - auf deren Ergebnis wird
+        gewartet. Die restlichen Punkte werden als kommaseparierte Koordinatenlisten in
+        einer Anfrage gesendet. Schlägt die Sammelabfrage fehl, wird pro Punkt
+        abgefragt (inkl. Fallback). Nur echte API-Antworten werden gecacht, damit
+        Fallback-Werte nicht für eine Stunde an einer Rasterzelle hängen bleiben.
+        
+        Args:
+            points: Liste von (latitude, longitude, altitude) Tupeln
+            forecast_time: Zeitpunkt für Vorhersage (UTC), None = aktuell
+            
+        Returns:
+            Liste von WindData in der Reihenfolge der Punkte
+        """
+        results: List[Optional[WindData]] = [None] * len(points)
+        missing = []
+        for i, (lat, lon, alt) in enumerate(points):
+            key = self._wind_cache_key(lat, lon, alt, forecast_time)
+            results[i] = self._get_cached_wind(key, lat, lon, alt)
+            if results[i] is None:
+                missing.append((i, key))
+        
+        if not missing:
+            return results
+        
+        # Zellen, die bereits eine andere Anfrage lädt, nicht doppelt abfragen
+        waiting = [(i, key, self._in_flight[key]) for i, key in missing if key in self._in_flight]
+        missing = [(i, key) for i, key in missing if key not in self._in_flight]
+        
+        if missing:
+            loop = asyncio.get_running_loop()
+            own = {key: loop.create_future() for _, key in missing}
+            self._in_flight.update(own)
+            try:
+                fetched = await self._fetch_wind_points([points[i] for i, _ in missing], forecast_time)
+                for (i, key), (wind_data, from_api) in zip(missing, fetched):
+                    if from_api:
+                        self._store_cached_wind(key, wind_data)
+                    results[i] = wind_data
+                    if not own[key].done():
+                        own[key].set_result(wind_data)
+            finally:
+                for key, future in own.items():
+                    if self._in_flight.get(key) is future:
+                        del self._in_flight[key]
+                    if not future.done():
+                        future.cancel()
+        
+        for i, key, future in waiting:
+            lat, lon, alt = points[i]
+            try:
+                wind_data = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Die ladende Anfrage wurde abgebrochen - selbst abfragen
+                wind_data, from_api = await self._fetch_wind_data(lat, lon, alt, forecast_time)
+                if from_api:
+                    self._store_cached_wind(key, wind_data)
+            results[i] = wind_data.model_copy(update={
+                "latitude": lat,
+                "longitude": lon,
+                "altitude": alt
+            })
+        return results
+    
+    async def _fetch_wind_points(self, points: List[Tuple[float, float, float]],
+                                 forecast_time: Optional[datetime] = None) -> List[Tuple[WindData, bool]]:
+        """Punkte ohne Cache abfragen - mehrere per Sammelabfrage, einzelne direkt
+
+        Returns:
+            Liste von (WindData, from_api) - from_api ist False bei Fallback-Daten
+        """
+        if len(points) > 1 and self.api_key and self.api_key != "your_windfinder_api_key_here":
+            fetched = await self._fetch_wind_data_batch(points, forecast_time)
+            if fetched is not None:
+                return [(wind_data, True) for wind_data in fetched]
+        return await asyncio.gather(*[
+            self._fetch_wind_data(lat, lon, alt, forecast_time) for lat, lon, alt in points
+        ])
+    
+    async def _fetch_wind_data_batch(self, points: List[Tuple[float, float, float]],
+                                     forecast_time: Optional[datetime] = None) -> Optional[List[WindData]]:
+        """Mehrpunkt-Abfrage bei Windfinder, None wenn die Antwort nicht verwendbar ist"""
+        try:
+            client = self._get_client()
+            params = {
+                "key": self.api_key,
+                "lat": ",".join(str(lat) for lat, _, _ in points),
+                "lon": ",".join(str(lon) for _, lon, _ in points),
+                "format": "json"
+            }
+            
+            if forecast_time:
+                params["time"] = forecast_time.strftime("%Y-%m-%d %H:%M:%S")
+            
+            async with self._request_limit:
+                response = await client.get(
+                    f"{self.base_url}/forecast",
+                    params=params
+                )
+            
+            if response.status_code != 200:
+                logger.warning("Windfinder API Error: %s", response.status_code)
+                return None
+            
+            # Eine Vorhersage pro angefragtem Punkt, in gleicher Reihenfolge
+            data = response.json()
+            if not isinstance(data, list) or len(data) != len(points):
+                return None
+            
+            parsed = [
+                self._parse_windfinder_response(entry, lat, lon, alt)
+                for entry, (lat, lon, alt) in zip(data, points)
+            ]
+            if any(wind_data is None for wind_data in parsed):
+                return None
+            return parsed
+            
+        except Exception:
+            logger.exception("Fehler beim Abrufen der Winddaten")
+            return None
+    
+    async def _fetch_wind_data(self, latitude: float, longitude: float, altitude: float,
+                               forecast_time: Optional[datetime] = None) -> Tuple[WindData, bool]:
+        """Winddaten ohne Cache von Windfinder API abrufen oder Fallback verwenden
+
+        Returns:
+            (WindData, from_api) - from_api ist False, wenn Fallback-Daten geliefert werden
+        """
         
         if not self.api_key or self.api_key == "your_windfinder_api_key_here":
-            return self._generate_fallback_wind_data(latitude, longitude, altitude, forecast_time)
+            return self._generate_fallback_wind_data(latitude, longitude, altitude, forecast_time), False
         
         try:
-            async with httpx.AsyncClient() as client:
-                params = {
-                    "key": self.api_key,
-                    "lat": latitude,
-                    "lon": longitude,
-                    "format": "json"
-                }
-                
-                # Zeitparameter hinzufügen wenn spezifiziert
-                if forecast_time:
-                    params["time"] = forecast_time.strftime("%Y-%m-%d %H:%M:%S")
-                
+            client = self._get_client()
+            params = {
+                "key": self.api_key,
+                "lat": latitude,
+                "lon": longitude,
+                "format": "json"
+            }
+            
+            # Zeitparameter hinzufügen wenn spezifiziert
+            if forecast_time:
+                params["time"] = forecast_time.strftime("%Y-%m-%d %H:%M:%S")
+            
+            async with self._request_limit:
                 response = await client.get(
                     f"{self.base_url}/forecast",
-                    params=params,
-                    timeout=10.0
+                    params=params
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_windfinder_response(data, latitude, longitude, altitude)
-                else:
-                    print(f"Windfinder API Error: {response.status_code}")
-                    return self._generate_fallback_wind_data(latitude, longitude, altitude, forecast_time)
+            
+            if response.status_code == 200:
+                data = response.json()
+                wind_data = self._parse_windfinder_response(data, latitude, longitude, altitude)
+                if wind_data is not None:
+                    return wind_data, True
+            else:
+                logger.warning("Windfinder API Error: %s", response.status_code)
                     
-        except Exception as e:
-            print(f"Fehler beim Abrufen der Winddaten: {e}")
-            return self._generate_fallback_wind_data(latitude, longitude, altitude, forecast_time)
+        except Exception:
+            logger.exception("Fehler beim Abrufen der Winddaten")
+        return self._generate_fallback_wind_data(latitude, longitude, altitude, forecast_time), False
     
-    def _parse_windfinder_response(self, data: Dict[Any, Any], lat: float, lon: float, alt: float) -> WindData:
-        """Parst die Antwort der Windfinder API"""
+    def _parse_windfinder_response(self, data: Dict[Any, Any], lat: float, lon: float, alt: float) -> Optional[WindData]:
+        """Parst die Antwort der Windfinder API, None wenn sie nicht lesbar ist"""
         try:
             # Beispiel-Parsing (echte API-Struktur kann abweichen)
             wind_speed_ms = data.get("wind", {}).get("speed", 5.0)
@@ -80,9 +299,9 @@ class WindService:
                 wind_vector_z=wind_vector_z,
                 timestamp=data.get("timestamp")
             )
-        except Exception as e:
-            print(f"Fehler beim Parsen der Winddaten: {e}")
-            return self._generate_fallback_wind_data(lat, lon, alt)
+        except Exception:
+            logger.exception("Fehler beim Parsen der Winddaten")
+            return None
     
     def _generate_fallback_wind_data(self, latitude: float, longitude: float, altitude: float, 
                                    forecast_time: Optional[datetime] = None) -> WindData:
@@ -166,26 +385,31 @@ class WindService:
         Returns:
             Liste von WindData für jeden Wegpunkt
         """
-        wind_vectors = []
         start_time = mission_start_time if mission_start_time else datetime.now(timezone.utc)
         
         # Zeitpunkte für jeden Wegpunkt berechnen
         time_per_waypoint = flight_duration_estimate / len(waypoints) if waypoints else 0
         
-        for i, wp in enumerate(waypoints):
-            # Zeitpunkt für diesen Wegpunkt
-            waypoint_time = start_time + timedelta(hours=i * time_per_waypoint)
-            
-            # Winddaten für diesen Punkt und Zeitpunkt abrufen
-            wind_data = await self.get_wind_data(
-                latitude=wp['lat'], 
-                longitude=wp['lon'], 
-                altitude=wp['alt'],
-                forecast_time=waypoint_time
+        waypoint_times = [start_time + timedelta(hours=i * time_per_waypoint) for i in range(len(waypoints))]
+        
+        # Wegpunkte nach Vorhersagestunde gruppieren - eine Sammelabfrage pro Stunde
+        hour_groups: Dict[int, List[int]] = {}
+        for i, waypoint_time in enumerate(waypoint_times):
+            hour_groups.setdefault(int(waypoint_time.timestamp() // 3600), []).append(i)
+        
+        batches = await asyncio.gather(*[
+            self.get_wind_data_batch(
+                [(waypoints[i]['lat'], waypoints[i]['lon'], waypoints[i]['alt']) for i in indices],
+                forecast_time=waypoint_times[indices[0]]
             )
-            
-            wind_vectors.append(wind_data)
-            
+            for indices in hour_groups.values()
+        ])
+        
+        # Ergebnisse in Wegpunkt-Reihenfolge zusammensetzen
+        wind_vectors: List[Optional[WindData]] = [None] * len(waypoints)
+        for indices, batch in zip(hour_groups.values(), batches):
+            for i, wind_data in zip(indices, batch):
+                wind_vectors[i] = wind_data
         return wind_vectors
     
     def create_manual_wind_data(self, latitude: float, longitude: float, altitude: float,
@@ -220,6 +444,42 @@ class WindService:
             timestamp=datetime.now(timezone.utc).isoformat()
         )
     
+    def create_manual_wind_data_batch(self, waypoints: List[Any], wind_speed_ms: float,
+                                      wind_direction_deg: float) -> List[WindData]:
+        """Erstellt manuelle WindData für mehrere Wegpunkte auf einmal
+        
+        Windvektor und Zeitstempel sind für alle Wegpunkte gleich und werden
+        daher nur einmal berechnet.
+        
+        Args:
+            waypoints: Wegpunkte mit latitude, longitude, altitude Attributen
+            wind_speed_ms: Manuelle Windgeschwindigkeit in m/s
+            wind_direction_deg: Manuelle Windrichtung in Grad (0-359)
+            
+        Returns:
+            Liste von WindData in der Reihenfolge der Wegpunkte
+        """
+        wind_rad = math.radians(wind_direction_deg)
+        wind_speed = round(wind_speed_ms, 2)
+        wind_vector_x = round(wind_speed_ms * math.sin(wind_rad), 2)
+        wind_vector_y = round(wind_speed_ms * math.cos(wind_rad), 2)
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
+        return [
+            WindData(
+                latitude=wp.latitude,
+                longitude=wp.longitude,
+                altitude=wp.altitude,
+                wind_speed_ms=wind_speed,
+                wind_direction_deg=wind_direction_deg,
+                wind_vector_x=wind_vector_x,
+                wind_vector_y=wind_vector_y,
+                wind_vector_z=0.0,
+                timestamp=timestamp
+            )
+            for wp in waypoints
+        ]
+    
     async def get_wind_vectors_for_route_with_manual_override(self, waypoints: List[Dict[str, float]],
                                                             manual_wind_speed_ms: float,
                                                             manual_wind_direction_deg: float) -> List[WindData]:
@@ -0,0 +1,56 @@
+"""Tests für die CompressedJSON-Spalte"""
+import orjson
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select, text
+
+from models.database import CompressedJSON
+
+
+class TestCompressedJSON:
+
+    @pytest.fixture
+    def table_engine(self):
+        """Fixture für eine In-Memory-Tabelle mit CompressedJSON-Spalte"""
+        engine = create_engine("sqlite://")
+        metadata = MetaData()
+        table = Table(
+            "results", metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", CompressedJSON),
+        )
+        metadata.create_all(engine)
+        yield table, engine
+        engine.dispose()
+
+    def test_compressed_round_trip(self, table_engine):
+        """Test dass geschriebene Werte komprimiert gespeichert und unverändert gelesen werden"""
+        table, engine = table_engine
+        result = {"total_energy": 12.5, "flight_segments": [{"segment_id": i} for i in range(50)]}
+
+        with engine.begin() as conn:
+            conn.execute(table.insert().values(id=1, data=result))
+            raw = conn.execute(text("SELECT data FROM results WHERE id = 1")).scalar_one()
+            loaded = conn.execute(select(table.c.data).where(table.c.id == 1)).scalar_one()
+
+        assert raw[:1] not in (b"{", b"[")
+        assert len(raw) < len(orjson.dumps(result))
+        assert loaded == result
+
+    def test_legacy_plain_json_rows(self, table_engine):
+        """Test dass unkomprimierte JSON-Zeilen aus der alten JSON-Spalte lesbar bleiben"""
+        table, engine = table_engine
+        legacy_object = {"total_energy": 3.0, "summary": {"battery_usage_percent": 7.5}}
+        legacy_list = [1, 2, 3]
+
+        with engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO results (id, data) VALUES (:id, :data)"),
+                [
+                    {"id": 1, "data": orjson.dumps(legacy_object)},
+                    {"id": 2, "data": orjson.dumps(legacy_list)},
+                    {"id": 3, "data": None},
+                ],
+            )
+            rows = dict(conn.execute(select(table.c.id, table.c.data)).all())
+
+        assert rows == {1: legacy_object, 2: legacy_list, 3: None}
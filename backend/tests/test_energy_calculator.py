@@ -22,6 +22,18 @@ class TestEnergyCalculator:
             Waypoint(latitude=49.4920, longitude=8.475, altitude=100, speed=10)
         ]
     
+    @pytest.fixture
+    def southwest_wind(self):
+        """Fixture für 6 m/s Südwestwind an jedem Waypoint einer Liste"""
+        def wind_for(waypoints):
+            return [
+                WindData(latitude=wp.latitude, longitude=wp.longitude, altitude=wp.altitude,
+                         wind_speed_ms=6, wind_direction_deg=225,
+                         wind_vector_x=-4.24, wind_vector_y=-4.24, wind_vector_z=0)
+                for wp in waypoints
+            ]
+        return wind_for
+    
     @pytest.fixture
     def quadcopter_config(self):
         """Fixture für Quadcopter-Konfiguration"""
@@ -60,6 +72,67 @@ class TestEnergyCalculator:
             propeller_efficiency=0.82
         )
 
+    @pytest.fixture
+    def multirotor_config(self):
+        """Fixture für Multirotor-Konfiguration ohne feste Hover-Power"""
+        return VehicleConfig(
+            vehicle_type=VehicleType.MULTIROTOR,
+            mass=8.0,
+            max_power=4000,
+            cruise_speed=10,
+            max_speed=12,
+            max_climb_rate=4,
+            max_descent_speed=2,
+            horizontal_acceleration=4,
+            vertical_acceleration=3,
+            battery_capacity=20000,
+            battery_voltage=22.2,
+            frame_type="hexa",
+            rotor_diameter=0.4,
+            drag_coefficient=0.3
+        )
+
+    @pytest.fixture
+    def vtol_config(self):
+        """Fixture für VTOL-Konfiguration (kurze Segmente im Hover-Modus)"""
+        return VehicleConfig(
+            vehicle_type=VehicleType.VTOL,
+            mass=6.0,
+            max_power=3000,
+            forward_thrust_power=500,
+            cruise_speed=6,
+            max_speed=20,
+            max_climb_rate=3,
+            max_descent_speed=2,
+            horizontal_acceleration=3,
+            vertical_acceleration=2,
+            battery_capacity=16000,
+            battery_voltage=22.2,
+            frame_type="quad",
+            wing_area=0.8
+        )
+
+    @pytest.fixture
+    def fixed_wing_config(self):
+        """Fixture für Plane-Konfiguration mit allen Pflichtfeldern"""
+        return VehicleConfig(
+            vehicle_type=VehicleType.PLANE,
+            mass=3.0,
+            max_power=1200,
+            cruise_speed=18,
+            max_speed=30,
+            max_climb_rate=8,
+            max_descent_speed=5,
+            horizontal_acceleration=2,
+            vertical_acceleration=2,
+            battery_capacity=15000,
+            battery_voltage=44.4,
+            drag_coefficient=0.025,
+            wing_area=0.6,
+            motor_efficiency=0.88,
+            propeller_efficiency=0.82
+        )
+
     def test_calculate_distance_horizontal(self, calculator, sample_waypoints):
         """Test horizontale Distanz-Berechnung"""
         wp1, wp2 = sample_waypoints[0], sample_waypoints[1]
@@ -290,3 +363,84 @@ class TestEnergyCalculator:
         )
         
         assert power_no_air > 0  # Sollte trotzdem funktionieren
+    
+    def _expected_segment(self, calculator, config, wp1, wp2, wind):
+        """Referenzwerte eines Segments aus den skalaren Einzelmethoden"""
+        if config.vehicle_type == VehicleType.MULTIROTOR:
+            expected = calculator.calculate_copter_interpolated_segments(config, wp1, wp2, wind)
+            return expected['total_distance'], expected['total_time'], expected['total_energy']
+        
+        distance = calculator.calculate_distance(wp1, wp2)
+        air_density = calculator.calculate_air_density((wp1.altitude + wp2.altitude) / 2)
+        speed = config.cruise_speed if distance > 100 else config.cruise_speed * 0.7
+        climb_rate = (wp2.altitude - wp1.altitude) / (distance / speed) if distance > 0 else 0
+        if config.vehicle_type == VehicleType.VTOL:
+            power = calculator.calculate_vtol_power(config, speed, climb_rate, air_density, wind)
+        else:
+            power = calculator.calculate_plane_power(config, speed, climb_rate, air_density, wind)
+        flight_time = distance / speed
+        return distance, flight_time, power * flight_time / 3600
+    
+    @pytest.mark.parametrize("vehicle", ["multirotor", "vtol", "fixed_wing"])
+    @pytest.mark.parametrize("with_wind", [False, True])
+    def test_mission_matches_segment_interpolation(self, request, calculator, vehicle,
+                                                   sample_waypoints, southwest_wind, with_wind):
+        """Test Array-Kernel liefert dieselben Segmente wie die Einzelberechnung"""
+        config = request.getfixturevalue(f"{vehicle}_config")
+        waypoints = sample_waypoints + [
+            Waypoint(latitude=49.4921, longitude=8.4751, altitude=100),  # kurzes Segment < 100 m
+            Waypoint(latitude=49.4921, longitude=8.4751, altitude=160),  # rein vertikal
+            Waypoint(latitude=49.4921, longitude=8.4751, altitude=160)   # keine Bewegung
+        ]
+        wind_data = southwest_wind(waypoints) if with_wind else None
+        
+        result = calculator.calculate_energy_consumption(config, waypoints, wind_data)
+        
+        assert len(result.flight_segments) == len(waypoints) - 1
+        for i, segment in enumerate(result.flight_segments):
+            distance, flight_time, energy = self._expected_segment(
+                calculator, config, waypoints[i], waypoints[i + 1], wind_data[i] if wind_data else None
+            )
+            assert segment.distance_m == pytest.approx(distance, rel=1e-9)
+            assert segment.duration_s == pytest.approx(flight_time, rel=1e-9)
+            assert segment.energy_wh == pytest.approx(energy, rel=1e-9)
+    
+    @pytest.mark.parametrize("vehicle", ["vtol", "fixed_wing"])
+    def test_mission_rejects_zero_cruise_speed(self, request, calculator, vehicle, sample_waypoints):
+        """Test VTOL/Plane ohne Reisegeschwindigkeit liefern einen Fehler statt NaN"""
+        config = request.getfixturevalue(f"{vehicle}_config")
+        config.cruise_speed = 0
+        
+        with pytest.raises(ValueError, match="Reisegeschwindigkeit"):
+            calculator.calculate_energy_consumption(config, sample_waypoints)
+    
+    @pytest.mark.parametrize("with_wind", [False, True])
+    def test_mission_without_segments_matches_full(self, calculator, multirotor_config,
+                                                   sample_waypoints, southwest_wind, with_wind):
+        """Test include_segments=False liefert dieselben Summen und dasselbe Summary"""
+        wind_data = southwest_wind(sample_waypoints) if with_wind else None
+        
+        full = calculator.calculate_energy_consumption(multirotor_config, sample_waypoints, wind_data)
+        totals_only = calculator.calculate_energy_consumption(
+            multirotor_config, sample_waypoints, wind_data, include_segments=False
+        )
+        
+        assert totals_only.flight_segments == []
+        assert totals_only.total_energy_wh == full.total_energy_wh
+        assert totals_only.total_distance_m == full.total_distance_m
+        assert totals_only.total_time_s == full.total_time_s
+        assert totals_only.battery_usage_percent == full.battery_usage_percent
+        assert totals_only.summary == full.summary
+    
+    def test_segments_df_matches_flight_segments(self, calculator, multirotor_config, sample_waypoints):
+        """Test segments_df enthält je Segment dieselben Werte wie flight_segments"""
+        pytest.importorskip("pandas")
+        
+        result = calculator.calculate_energy_consumption(multirotor_config, sample_waypoints)
+        df = calculator.segments_df(multirotor_config, sample_waypoints)
+        
+        assert len(df) == len(result.flight_segments)
+        assert df["segment_id"].tolist() == [segment.segment_id for segment in result.flight_segments]
+        assert df["energy_wh"].tolist() == [segment.energy_wh for segment in result.flight_segments]
+        assert df["duration_s"].tolist() == [segment.duration_s for segment in result.flight_segments]
+        assert df["distance_m"].tolist() == [segment.distance_m for segment in result.flight_segments]
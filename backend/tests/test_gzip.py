@@ -0,0 +1,67 @@
+"""Tests für die gzip-Aushandlung über Accept-Encoding"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+import main
+from main import QValueGZipMiddleware, _accepts_gzip
+
+
+LARGE_BODY = b"x" * 4096
+
+
+class TestGzipNegotiation:
+
+    @pytest.fixture
+    def middleware_client(self):
+        """Fixture für eine App mit großer Antwort hinter der GZip-Middleware"""
+        app = FastAPI()
+        app.add_middleware(QValueGZipMiddleware, minimum_size=1024)
+
+        @app.get("/large")
+        def large():
+            return Response(content=LARGE_BODY, media_type="text/plain")
+
+        return TestClient(app)
+
+    @pytest.fixture
+    def app_client(self):
+        """Fixture für die Haupt-App (ohne Lifespan, /api/vehicles braucht keine DB)"""
+        return TestClient(main.app)
+
+    @pytest.mark.parametrize("accept_encoding, expected", [
+        ("gzip", True),
+        ("GZIP;Q=1", True),
+        ("br, gzip;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, identity", False),
+        ("gzip;q=0, *", False),
+        ("*;q=0", False),
+        ("identity", False),
+        ("", False),
+    ])
+    def test_accepts_gzip(self, accept_encoding, expected):
+        """Test q-Werte entscheiden, nicht das bloße Vorkommen von "gzip\""""
+        assert _accepts_gzip(accept_encoding) is expected
+
+    def test_middleware_honours_q_zero(self, middleware_client):
+        """Test gzip;q=0 erhält den unkomprimierten Body über die Middleware"""
+        response = middleware_client.get("/large", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "content-encoding" not in response.headers
+        assert response.content == LARGE_BODY
+
+        response = middleware_client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == LARGE_BODY
+
+    def test_vehicles_honours_q_zero(self, app_client):
+        """Test gzip;q=0 erhält die unkomprimierte Fahrzeugliste"""
+        response = app_client.get("/api/vehicles", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "content-encoding" not in response.headers
+        assert response.content == main._VEHICLES_JSON
+
+        response = app_client.get("/api/vehicles", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == main._VEHICLES_JSON
@@ -0,0 +1,71 @@
+"""Tests für den Wind-Cache des WindService"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+import services.wind_service as wind_module
+from services.wind_service import WindService, WIND_CACHE_TTL_S
+from models.waypoint import WindData
+
+
+FORECAST_TIME = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestWindCache:
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        """Fixture für WindService mit API-Key und gezählten API-Abfragen"""
+        monkeypatch.setenv("WINDFINDER_API_KEY", "test-key")
+        service = WindService()
+        service.api_calls = 0
+
+        async def fake_fetch(latitude, longitude, altitude, forecast_time=None):
+            service.api_calls += 1
+            return WindData(
+                latitude=latitude, longitude=longitude, altitude=altitude,
+                wind_speed_ms=4.0, wind_direction_deg=90.0,
+                wind_vector_x=4.0, wind_vector_y=0.0, wind_vector_z=0.0
+            ), True
+
+        monkeypatch.setattr(service, "_fetch_wind_data", fake_fetch)
+        return service
+
+    def test_cache_miss_then_hit(self, service):
+        """Test dass eine API-Antwort gecacht und für dieselbe Rasterzelle wiederverwendet wird"""
+        first = asyncio.run(service.get_wind_data(49.4871, 8.4661, 100, FORECAST_TIME))
+        assert service.api_calls == 1
+        assert len(service._wind_cache) == 1
+
+        # Gleiche Rasterzelle, leicht verschobene Position
+        second = asyncio.run(service.get_wind_data(49.4872, 8.4662, 110, FORECAST_TIME))
+        assert service.api_calls == 1
+        assert second.wind_speed_ms == first.wind_speed_ms
+        assert second.latitude == 49.4872
+        assert second.altitude == 110
+
+    def test_cache_expiry(self, service, monkeypatch):
+        """Test dass abgelaufene Einträge neu abgefragt werden"""
+        now = [1000.0]
+        monkeypatch.setattr(wind_module.time, "monotonic", lambda: now[0])
+
+        asyncio.run(service.get_wind_data(49.4871, 8.4661, 100, FORECAST_TIME))
+        now[0] += WIND_CACHE_TTL_S - 1
+        asyncio.run(service.get_wind_data(49.4871, 8.4661, 100, FORECAST_TIME))
+        assert service.api_calls == 1
+
+        now[0] += 2
+        asyncio.run(service.get_wind_data(49.4871, 8.4661, 100, FORECAST_TIME))
+        assert service.api_calls == 2
+
+    def test_fallback_data_not_cached(self, monkeypatch):
+        """Test dass Fallback-Winddaten ohne API-Key nicht gecacht werden"""
+        monkeypatch.delenv("WINDFINDER_API_KEY", raising=False)
+        service = WindService()
+
+        points = [(49.4871, 8.4661, 100), (49.4900, 8.470, 120)]
+        wind = asyncio.run(service.get_wind_data_batch(points, FORECAST_TIME))
+
+        assert len(wind) == 2
+        assert service._wind_cache == {}